@@ -0,0 +1,48 @@
+"""Add covering indexes for debt and expense lookups
+
+Revision ID: 3a9d5e7f1b86
+Revises: e1f08b6c3a45
+Create Date: 2026-10-15 11:24:09.847312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9d5e7f1b86'
+down_revision: Union[str, Sequence[str], None] = 'e1f08b6c3a45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_debt_group_user_to', 'debt_balances',
+        ['group_id', 'user_to'],
+        postgresql_include=['amount']
+    )
+    op.create_index(
+        'idx_debt_group_user_from', 'debt_balances',
+        ['group_id', 'user_from'],
+        postgresql_include=['amount']
+    )
+    
+    # Rebuild the payer index so sums over a payer's expenses are index-only
+    op.drop_index('idx_expense_paid_by', table_name='expenses')
+    op.create_index(
+        'idx_expense_paid_by', 'expenses',
+        ['paid_by'],
+        postgresql_include=['amount']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_expense_paid_by', table_name='expenses')
+    op.create_index('idx_expense_paid_by', 'expenses', ['paid_by'])
+    op.drop_index('idx_debt_group_user_from', table_name='debt_balances')
+    op.drop_index('idx_debt_group_user_to', table_name='debt_balances')
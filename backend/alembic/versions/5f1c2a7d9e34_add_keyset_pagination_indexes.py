@@ -0,0 +1,41 @@
+"""Add keyset pagination indexes
+
+Revision ID: 5f1c2a7d9e34
+Revises: 2d9834e1b0b8
+Create Date: 2026-10-15 09:12:04.318275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f1c2a7d9e34'
+down_revision: Union[str, Sequence[str], None] = '2d9834e1b0b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_activity_user_timestamp', 'activity_logs',
+        ['user_id', sa.text('timestamp DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_activity_group_timestamp', 'activity_logs',
+        ['group_id', sa.text('timestamp DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_settlement_group_date', 'settlements',
+        ['group_id', sa.text('date DESC'), sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_settlement_group_date', table_name='settlements')
+    op.drop_index('idx_activity_group_timestamp', table_name='activity_logs')
+    op.drop_index('idx_activity_user_timestamp', table_name='activity_logs')
@@ -0,0 +1,35 @@
+"""Add expense membership indexes
+
+Revision ID: 8b3e6f0a2c71
+Revises: 5f1c2a7d9e34
+Create Date: 2026-10-15 10:02:37.551904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b3e6f0a2c71'
+down_revision: Union[str, Sequence[str], None] = '5f1c2a7d9e34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_expense_created_by', 'expenses', ['created_by'])
+    op.create_index('idx_expense_paid_by', 'expenses', ['paid_by'])
+    op.create_index(
+        'idx_expense_split_user_expense', 'expense_splits',
+        ['user_id', 'expense_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_expense_split_user_expense', table_name='expense_splits')
+    op.drop_index('idx_expense_paid_by', table_name='expenses')
+    op.drop_index('idx_expense_created_by', table_name='expenses')
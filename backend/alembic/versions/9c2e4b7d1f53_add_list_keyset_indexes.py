@@ -0,0 +1,36 @@
+"""Add keyset pagination indexes for expense and group lists
+
+Revision ID: 9c2e4b7d1f53
+Revises: 3a9d5e7f1b86
+Create Date: 2026-10-15 12:06:41.205938
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2e4b7d1f53'
+down_revision: Union[str, Sequence[str], None] = '3a9d5e7f1b86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_expense_date_created', 'expenses',
+        [sa.text('date DESC'), sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_group_created_at', 'groups',
+        [sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_group_created_at', table_name='groups')
+    op.drop_index('idx_expense_date_created', table_name='expenses')
@@ -0,0 +1,49 @@
+"""Store money amounts as integer cents
+
+Revision ID: a1d6e8b3c472
+Revises: f7c2a9e4b351
+Create Date: 2026-10-15 17:58:31.640925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1d6e8b3c472'
+down_revision: Union[str, Sequence[str], None] = 'f7c2a9e4b351'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    ('expenses', 'amount'),
+    ('expense_splits', 'share_amount'),
+    ('settlements', 'amount'),
+    ('debt_balances', 'amount'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.BigInteger(),
+            existing_nullable=False,
+            postgresql_using=f'round({column} * 100)::bigint'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Numeric(10, 2),
+            existing_nullable=False,
+            postgresql_using=f'{column} / 100.0'
+        )
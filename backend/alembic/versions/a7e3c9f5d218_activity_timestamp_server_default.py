@@ -0,0 +1,32 @@
+"""Fill activity log timestamps in the database
+
+Revision ID: a7e3c9f5d218
+Revises: f2b5c8d1a734
+Create Date: 2026-10-15 14:02:37.518264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e3c9f5d218'
+down_revision: Union[str, Sequence[str], None] = 'f2b5c8d1a734'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'activity_logs',
+        'timestamp',
+        server_default=sa.text("timezone('utc', now())")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('activity_logs', 'timestamp', server_default=None)
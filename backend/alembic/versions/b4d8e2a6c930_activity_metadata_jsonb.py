@@ -0,0 +1,39 @@
+"""Store activity metadata as JSONB
+
+Revision ID: b4d8e2a6c930
+Revises: a7e3c9f5d218
+Create Date: 2026-10-15 14:26:09.731845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8e2a6c930'
+down_revision: Union[str, Sequence[str], None] = 'a7e3c9f5d218'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'activity_logs',
+        'action_metadata',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='action_metadata::jsonb'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'activity_logs',
+        'action_metadata',
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        postgresql_using='action_metadata::json'
+    )
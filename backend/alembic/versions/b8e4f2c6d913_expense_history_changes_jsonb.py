@@ -0,0 +1,79 @@
+"""Store one expense history row per edit with a JSONB diff
+
+Revision ID: b8e4f2c6d913
+Revises: a1d6e8b3c472
+Create Date: 2026-10-15 18:34:52.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4f2c6d913'
+down_revision: Union[str, Sequence[str], None] = 'a1d6e8b3c472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The model was never registered with the metadata, so databases set up
+    # from it may not have the table at all
+    if not sa.inspect(op.get_bind()).has_table('expense_history'):
+        op.create_table(
+            'expense_history',
+            sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+            sa.Column('expense_id', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('edited_by', postgresql.UUID(as_uuid=True), nullable=True),
+            sa.Column('edited_at', sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+            sa.Column('changes', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+            sa.ForeignKeyConstraint(['expense_id'], ['expenses.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['edited_by'], ['users.id'], ondelete='SET NULL'),
+            sa.PrimaryKeyConstraint('id')
+        )
+    else:
+        op.add_column('expense_history', sa.Column('changes', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+        # Collapse the per-field rows of each edit into a single row
+        op.execute("""
+            INSERT INTO expense_history (id, expense_id, edited_by, edited_at, field_changed, changes)
+            SELECT gen_random_uuid(), expense_id, edited_by, edited_at, '',
+                   jsonb_object_agg(field_changed, jsonb_build_array(old_value, new_value))
+            FROM expense_history
+            GROUP BY expense_id, edited_by, edited_at
+        """)
+        op.execute("DELETE FROM expense_history WHERE changes IS NULL")
+        op.alter_column('expense_history', 'changes', nullable=False)
+        op.drop_column('expense_history', 'field_changed')
+        op.drop_column('expense_history', 'old_value')
+        op.drop_column('expense_history', 'new_value')
+        op.alter_column('expense_history', 'id', server_default=sa.text('gen_random_uuid()'))
+        op.alter_column('expense_history', 'edited_at', server_default=sa.text("timezone('utc', now())"))
+
+    op.create_index(
+        'idx_expense_history_expense_edited',
+        'expense_history',
+        ['expense_id', sa.text('edited_at DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_expense_history_expense_edited', table_name='expense_history')
+    op.add_column('expense_history', sa.Column('field_changed', sa.String(length=50), nullable=True))
+    op.add_column('expense_history', sa.Column('old_value', sa.String(length=500), nullable=True))
+    op.add_column('expense_history', sa.Column('new_value', sa.String(length=500), nullable=True))
+    # Expand each edit back into one row per changed field
+    op.execute("""
+        INSERT INTO expense_history (id, expense_id, edited_by, edited_at, changes, field_changed, old_value, new_value)
+        SELECT gen_random_uuid(), h.expense_id, h.edited_by, h.edited_at, '{}'::jsonb,
+               c.key, c.value ->> 0, c.value ->> 1
+        FROM expense_history h, jsonb_each(h.changes) AS c
+    """)
+    op.execute("DELETE FROM expense_history WHERE field_changed IS NULL")
+    op.alter_column('expense_history', 'field_changed', nullable=False)
+    op.drop_column('expense_history', 'changes')
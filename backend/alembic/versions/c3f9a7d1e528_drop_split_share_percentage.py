@@ -0,0 +1,31 @@
+"""Drop expense split share_percentage
+
+Revision ID: c3f9a7d1e528
+Revises: b8e4f2c6d913
+Create Date: 2026-10-15 19:02:17.385540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f9a7d1e528'
+down_revision: Union[str, Sequence[str], None] = 'b8e4f2c6d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_column('expense_splits', 'share_percentage')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        'expense_splits',
+        sa.Column('share_percentage', sa.Numeric(precision=5, scale=2), nullable=True)
+    )
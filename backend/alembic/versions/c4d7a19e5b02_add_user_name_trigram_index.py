@@ -0,0 +1,33 @@
+"""Add user name trigram index
+
+Revision ID: c4d7a19e5b02
+Revises: 8b3e6f0a2c71
+Create Date: 2026-10-15 10:41:18.204736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7a19e5b02'
+down_revision: Union[str, Sequence[str], None] = '8b3e6f0a2c71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_user_name_trgm', 'users', ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_user_name_trgm', table_name='users')
@@ -0,0 +1,31 @@
+"""Add group/category index on expenses
+
+Revision ID: c5f1a8d3e647
+Revises: b4d8e2a6c930
+Create Date: 2026-10-15 14:51:44.203816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f1a8d3e647'
+down_revision: Union[str, Sequence[str], None] = 'b4d8e2a6c930'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_expense_group_category_date', 'expenses',
+        ['group_id', 'category', sa.text('date DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_expense_group_category_date', table_name='expenses')
@@ -0,0 +1,56 @@
+"""Allow one split per participant of an expense
+
+Revision ID: d4a8e2b6f195
+Revises: c3f9a7d1e528
+Create Date: 2026-10-15 19:41:06.527319
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8e2b6f195'
+down_revision: Union[str, Sequence[str], None] = 'c3f9a7d1e528'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Merge duplicate shares into the earliest split so expense totals still add up
+    op.execute("""
+        WITH ranked AS (
+            SELECT id,
+                   row_number() OVER (PARTITION BY expense_id, user_id ORDER BY created_at, id) AS rn,
+                   count(*) OVER (PARTITION BY expense_id, user_id) AS copies,
+                   sum(share_amount) OVER (PARTITION BY expense_id, user_id) AS total
+            FROM expense_splits
+        )
+        UPDATE expense_splits s
+        SET share_amount = ranked.total
+        FROM ranked
+        WHERE s.id = ranked.id AND ranked.rn = 1 AND ranked.copies > 1
+    """)
+    op.execute("""
+        DELETE FROM expense_splits s
+        USING (
+            SELECT id, row_number() OVER (PARTITION BY expense_id, user_id ORDER BY created_at, id) AS rn
+            FROM expense_splits
+        ) ranked
+        WHERE s.id = ranked.id AND ranked.rn > 1
+    """)
+    op.execute("""
+        UPDATE expenses e
+        SET split_count = c.n
+        FROM (SELECT expense_id, count(*) AS n FROM expense_splits GROUP BY expense_id) c
+        WHERE e.id = c.expense_id AND e.split_count <> c.n
+    """)
+    op.create_unique_constraint('uq_split_expense_user', 'expense_splits', ['expense_id', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_split_expense_user', 'expense_splits', type_='unique')
@@ -0,0 +1,51 @@
+"""Add composite indexes for expense list filters
+
+Revision ID: d6a0f3c8e912
+Revises: 9c2e4b7d1f53
+Create Date: 2026-10-15 12:41:17.093526
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6a0f3c8e912'
+down_revision: Union[str, Sequence[str], None] = '9c2e4b7d1f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The (column, date) indexes replace the single-column ones
+    op.drop_index('idx_expense_created_by', table_name='expenses')
+    op.drop_index('idx_expense_paid_by', table_name='expenses')
+    op.create_index(
+        'idx_expense_created_by_date', 'expenses',
+        ['created_by', sa.text('date DESC')]
+    )
+    op.create_index(
+        'idx_expense_paid_by_date', 'expenses',
+        ['paid_by', sa.text('date DESC')],
+        postgresql_include=['amount']
+    )
+    op.create_index(
+        'idx_expense_group_date', 'expenses',
+        ['group_id', sa.text('date DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_expense_group_date', table_name='expenses')
+    op.drop_index('idx_expense_paid_by_date', table_name='expenses')
+    op.drop_index('idx_expense_created_by_date', table_name='expenses')
+    op.create_index(
+        'idx_expense_paid_by', 'expenses',
+        ['paid_by'],
+        postgresql_include=['amount']
+    )
+    op.create_index('idx_expense_created_by', 'expenses', ['created_by'])
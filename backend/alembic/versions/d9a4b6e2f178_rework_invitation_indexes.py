@@ -0,0 +1,44 @@
+"""Rework invitation indexes
+
+Revision ID: d9a4b6e2f178
+Revises: c5f1a8d3e647
+Create Date: 2026-10-15 15:07:21.884930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a4b6e2f178'
+down_revision: Union[str, Sequence[str], None] = 'c5f1a8d3e647'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Duplicates the unique index on token
+    op.drop_index('idx_invitation_token', table_name='invitations')
+    op.create_index(
+        'idx_invitation_invitee_status', 'invitations',
+        ['invitee_id', 'status']
+    )
+    op.create_index(
+        'idx_invitation_email_status', 'invitations',
+        ['invitee_email', 'status']
+    )
+    op.create_index(
+        'idx_invitation_status_expires', 'invitations',
+        ['status', 'expires_at']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_invitation_status_expires', table_name='invitations')
+    op.drop_index('idx_invitation_email_status', table_name='invitations')
+    op.drop_index('idx_invitation_invitee_status', table_name='invitations')
+    op.create_index('idx_invitation_token', 'invitations', ['token'])
@@ -0,0 +1,31 @@
+"""Add group member user index
+
+Revision ID: e1f08b6c3a45
+Revises: c4d7a19e5b02
+Create Date: 2026-10-15 11:05:52.693120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f08b6c3a45'
+down_revision: Union[str, Sequence[str], None] = 'c4d7a19e5b02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_group_member_user_group', 'group_members',
+        ['user_id', 'group_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_group_member_user_group', table_name='group_members')
@@ -0,0 +1,44 @@
+"""Generate UUID primary keys in the database
+
+Revision ID: e3b7c1d5f829
+Revises: d9a4b6e2f178
+Create Date: 2026-10-15 16:48:09.274513
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7c1d5f829'
+down_revision: Union[str, Sequence[str], None] = 'd9a4b6e2f178'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'users',
+    'groups',
+    'group_members',
+    'expenses',
+    'expense_splits',
+    'settlements',
+    'debt_balances',
+    'invitations',
+    'activity_logs',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gen_random_uuid() is built in from PostgreSQL 13; older servers need pgcrypto
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,40 @@
+"""Add stored split count to expenses
+
+Revision ID: f2b5c8d1a734
+Revises: d6a0f3c8e912
+Create Date: 2026-10-15 13:18:52.640173
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b5c8d1a734'
+down_revision: Union[str, Sequence[str], None] = 'd6a0f3c8e912'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'expenses',
+        sa.Column('split_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.execute(
+        """
+        UPDATE expenses
+        SET split_count = (
+            SELECT COUNT(*) FROM expense_splits
+            WHERE expense_splits.expense_id = expenses.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('expenses', 'split_count')
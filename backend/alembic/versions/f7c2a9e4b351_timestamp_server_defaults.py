@@ -0,0 +1,45 @@
+"""Fill created/updated timestamps in the database
+
+Revision ID: f7c2a9e4b351
+Revises: e3b7c1d5f829
+Create Date: 2026-10-15 17:21:44.806137
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c2a9e4b351'
+down_revision: Union[str, Sequence[str], None] = 'e3b7c1d5f829'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('groups', 'created_at'),
+    ('groups', 'updated_at'),
+    ('group_members', 'joined_at'),
+    ('expenses', 'created_at'),
+    ('expenses', 'updated_at'),
+    ('expense_splits', 'created_at'),
+    ('settlements', 'created_at'),
+    ('debt_balances', 'last_updated'),
+    ('invitations', 'created_at'),
+    ('invitations', 'updated_at'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -1,23 +1,27 @@
 """Activity log API endpoints."""
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from app.core.cache import cache_per_user
 from app.core.database import get_db
 from app.schemas.activity import ActivityFeedItem
 from app.services import activity_service
 from app.utils.dependencies import get_current_user
+from app.models.activity_log import ActivityLog
 from app.models.user import User
-from app.models.group import Group
 
 router = APIRouter(prefix="/activity", tags=["Activity Feed"])
 
 
 @router.get("/feed", response_model=dict)
+@cache_per_user()
 def get_activity_feed(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -27,35 +31,19 @@ def get_activity_feed(
     Returns activities from all groups the user is a member of,
     plus the user's personal activities.
     
-    Activities are sorted by most recent first.
+    Activities are sorted by most recent first. Pass the returned
+    next_cursor back as cursor to fetch the following page without OFFSET.
     """
-    activities, total_count = activity_service.get_user_activity_feed(
-        db, current_user.id, page, limit
+    activities, total_count, next_cursor = activity_service.get_user_activity_feed(
+        db, current_user.id, page, limit, cursor
     )
     
     # Build feed items with formatted messages
-    feed_items = []
-    for activity in activities:
-        # Get user and group names
-        user = db.query(User).filter(User.id == activity.user_id).first()
-        group = db.query(Group).filter(Group.id == activity.group_id).first() if activity.group_id else None
-        
-        # Format message
-        message = activity_service.format_activity_message(activity, db)
-        
-        feed_items.append(ActivityFeedItem(
-            id=activity.id,
-            user_id=activity.user_id,
-            user_name=user.name if user else "Unknown",
-            action=activity.action_type.value,
-            entity_type=activity.entity_type.value,
-            entity_id=activity.entity_id,
-            message=message,
-            group_id=activity.group_id,
-            group_name=group.name if group else None,
-            created_at=activity.timestamp,
-            metadata=activity.action_metadata
-        ))
+    entity_cache = activity_service.load_activity_entities(db, activities)
+    messages = activity_service.format_activity_messages(activities, entity_cache)
+    feed_items = [
+        _build_feed_item(activity, messages[activity.id]) for activity in activities
+    ]
     
     return {
         "data": feed_items,
@@ -63,7 +51,8 @@ def get_activity_feed(
             "page": page,
             "limit": limit,
             "total_count": total_count,
-            "total_pages": (total_count + limit - 1) // limit
+            "total_pages": (total_count + limit - 1) // limit,
+            "next_cursor": next_cursor
         }
     }
 
@@ -73,6 +62,7 @@ def get_group_activity_feed(
     group_id: UUID,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -81,31 +71,16 @@ def get_group_activity_feed(
     
     User must be a member of the group to access this endpoint.
     """
-    activities, total_count = activity_service.get_group_activity_feed(
-        db, group_id, current_user.id, page, limit
+    activities, total_count, next_cursor = activity_service.get_group_activity_feed(
+        db, group_id, current_user.id, page, limit, cursor
     )
     
-    # Build feed items
-    feed_items = []
-    for activity in activities:
-        user = db.query(User).filter(User.id == activity.user_id).first()
-        group = db.query(Group).filter(Group.id == activity.group_id).first()
-        
-        message = activity_service.format_activity_message(activity, db)
-        
-        feed_items.append(ActivityFeedItem(
-            id=activity.id,
-            user_id=activity.user_id,
-            user_name=user.name if user else "Unknown",
-            action=activity.action_type.value,
-            entity_type=activity.entity_type.value,
-            entity_id=activity.entity_id,
-            message=message,
-            group_id=activity.group_id,
-            group_name=group.name if group else None,
-            created_at=activity.timestamp,
-            metadata=activity.action_metadata
-        ))
+    entity_cache = activity_service.load_activity_entities(db, activities)
+    messages = activity_service.format_activity_messages(activities, entity_cache)
+    
+    feed_items = [
+        _build_feed_item(activity, messages[activity.id]) for activity in activities
+    ]
     
     return {
         "data": feed_items,
@@ -113,6 +88,28 @@ def get_group_activity_feed(
             "page": page,
             "limit": limit,
             "total_count": total_count,
-            "total_pages": (total_count + limit - 1) // limit
+            "total_pages": (total_count + limit - 1) // limit,
+            "next_cursor": next_cursor
         }
     }
+
+
+def _build_feed_item(activity: ActivityLog, message: str) -> ActivityFeedItem:
+    """Build a feed item from an activity with loaded user and group."""
+    user = activity.user
+    group = activity.group
+    
+    # Values come straight from the database, skip validation
+    return ActivityFeedItem.model_construct(
+        id=activity.id,
+        user_id=activity.user_id,
+        user_name=user.name if user else "Unknown",
+        action=activity.action_type.value,
+        entity_type=activity.entity_type.value,
+        entity_id=activity.entity_id,
+        message=message,
+        group_id=activity.group_id,
+        group_name=group.name if group else None,
+        created_at=activity.timestamp,
+        metadata=activity.action_metadata
+    )
@@ -1,10 +1,12 @@
 """Analytics and dashboard API endpoints."""
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import select, func, case, true, union
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
 from datetime import date
 
+from app.core.cache import cache_per_user, cached_response, etag_per_user
 from app.core.database import get_db
 from app.schemas.analytics import (
     DashboardSummary, GroupAnalytics
@@ -20,7 +22,10 @@ router = APIRouter(prefix="/analytics", tags=["Analytics & Dashboard"])
 
 
 @router.get("/dashboard", response_model=DashboardSummary)
+@etag_per_user
 def get_user_dashboard(
+    request: Request,
+    response: Response,
     months: int = Query(6, ge=1, le=24, description="Number of months for trends"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -37,13 +42,26 @@ def get_user_dashboard(
     - Top 5 categories
     
     The dashboard provides a comprehensive overview of the user's financial activity.
+    The serialized JSON is cached per user, so repeat loads skip both the
+    queries and response validation; clients revalidating with the ETag
+    get 304 Not Modified until their data changes.
     """
-    dashboard = analytics_service.get_user_dashboard(db, current_user.id, months)
-    return dashboard
+    body = cached_response(
+        request,
+        current_user.id,
+        lambda: DashboardSummary.model_validate(
+            analytics_service.get_user_dashboard(db, current_user.id, months)
+        ).model_dump_json(by_alias=True)
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/groups/{group_id}", response_model=GroupAnalytics)
+@etag_per_user
+@cache_per_user()
 def get_group_analytics(
+    request: Request,
+    response: Response,
     group_id: UUID,
     start_date: Optional[date] = Query(None, description="Filter from this date"),
     end_date: Optional[date] = Query(None, description="Filter until this date"),
@@ -61,6 +79,9 @@ def get_group_analytics(
     - Most active member
     
     Optionally filter by date range for specific period analysis.
+    Results are cached per user and dropped whenever an expense,
+    settlement or membership of the group changes; the ETag changes at
+    the same time.
     """
     analytics = analytics_service.get_group_analytics(
         db, group_id, current_user.id, start_date, end_date
@@ -69,7 +90,9 @@ def get_group_analytics(
 
 
 @router.get("/summary")
+@cache_per_user()
 def get_quick_summary(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -78,37 +101,59 @@ def get_quick_summary(
     
     Returns key metrics without detailed breakdowns.
     Useful for quick checks or mobile apps.
-    """    
-    # Get total expenses
-    user_expenses = db.query(Expense).filter(
-        (Expense.created_by == current_user.id) |
-        (Expense.paid_by == current_user.id) |
-        (Expense.id.in_(
-            db.query(ExpenseSplit.expense_id).filter(ExpenseSplit.user_id == current_user.id)
-        ))
-    ).all()
+    """
+    uid = current_user.id
+    
+    # Every expense the user created, paid or shares in. Each UNION leg can
+    # use its own index, unlike an OR across columns with an IN subquery;
+    # UNION also drops expenses matched by more than one leg.
+    created = select(Expense.id, Expense.amount, Expense.paid_by).where(Expense.created_by == uid)
+    paid = select(Expense.id, Expense.amount, Expense.paid_by).where(Expense.paid_by == uid)
+    shared = select(Expense.id, Expense.amount, Expense.paid_by).join(
+        ExpenseSplit, ExpenseSplit.expense_id == Expense.id
+    ).where(ExpenseSplit.user_id == uid)
+    user_expenses = union(created, paid, shared).subquery("user_expenses")
     
-    total_expenses = sum(exp.amount for exp in user_expenses)
-    total_paid = sum(exp.amount for exp in user_expenses if exp.paid_by == current_user.id)
+    expense_totals = select(
+        func.coalesce(func.sum(user_expenses.c.amount), 0).label("total_expenses"),
+        func.coalesce(
+            func.sum(case((user_expenses.c.paid_by == uid, user_expenses.c.amount), else_=0)), 0
+        ).label("total_paid"),
+        func.count(user_expenses.c.id).label("expense_count")
+    ).cte("expense_totals")
     
-    # Get debt balances
-    owed_to_user = db.query(DebtBalance).filter(DebtBalance.user_to == current_user.id).all()
-    user_owes = db.query(DebtBalance).filter(DebtBalance.user_from == current_user.id).all()
+    # Debt totals in both directions
+    debt_totals = select(
+        func.coalesce(
+            func.sum(case((DebtBalance.user_to == uid, DebtBalance.amount), else_=0)), 0
+        ).label("total_owed_to_me"),
+        func.coalesce(
+            func.sum(case((DebtBalance.user_from == uid, DebtBalance.amount), else_=0)), 0
+        ).label("total_i_owe")
+    ).where(
+        (DebtBalance.user_to == uid) | (DebtBalance.user_from == uid)
+    ).cte("debt_totals")
     
-    total_owed_to_user = sum(debt.amount for debt in owed_to_user)
-    total_user_owes = sum(debt.amount for debt in user_owes)
+    # Group count
+    group_totals = select(
+        func.count(GroupMember.id).label("group_count")
+    ).where(GroupMember.user_id == uid).cte("group_totals")
     
-    # Get group count
-    group_count = db.query(GroupMember).filter(GroupMember.user_id == current_user.id).count()
+    # All three single-row CTEs are cross-joined into one round-trip
+    totals = db.execute(
+        select(expense_totals, debt_totals, group_totals).select_from(
+            expense_totals.join(debt_totals, true()).join(group_totals, true())
+        )
+    ).one()
     
     return {
         "user_id": current_user.id,
         "user_name": current_user.name,
-        "total_expenses": total_expenses,
-        "total_paid": total_paid,
-        "total_owed_to_me": total_owed_to_user,
-        "total_i_owe": total_user_owes,
-        "net_balance": total_owed_to_user - total_user_owes,
-        "expense_count": len(user_expenses),
-        "group_count": group_count
+        "total_expenses": totals.total_expenses,
+        "total_paid": totals.total_paid,
+        "total_owed_to_me": totals.total_owed_to_me,
+        "total_i_owe": totals.total_i_owe,
+        "net_balance": totals.total_owed_to_me - totals.total_i_owe,
+        "expense_count": totals.expense_count,
+        "group_count": totals.group_count
     }
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from typing import Any, Dict
 
 from app.core.database import get_db
 from app.schemas.auth import LoginRequest, SignupRequest, AuthResponse, Token
@@ -11,6 +13,23 @@ from app.models.user import User
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def _user_payload(user: User) -> Dict[str, Any]:
+    """
+    Serialize a user exactly as UserResponse would.
+    
+    The values come straight from the database, so building the dict
+    directly skips the from_orm validation and the response_model pass.
+    """
+    return {
+        "name": user.name,
+        "email": user.email,
+        "id": user.id,
+        "avatar_url": user.avatar_url,
+        "role": user.role.value,
+        "created_at": user.created_at
+    }
+
+
 @router.post("/signup", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
 def signup(
     signup_data: SignupRequest,
@@ -33,9 +52,9 @@ def signup(
     token = auth_service.generate_token(user)
     
     # Return user and token
-    return AuthResponse(
-        user=UserResponse.from_orm(user).dict(),
-        token=token
+    return ORJSONResponse(
+        {"user": _user_payload(user), "token": token.model_dump()},
+        status_code=status.HTTP_201_CREATED
     )
 
 
@@ -56,10 +75,7 @@ def login(
     token = auth_service.generate_token(user)
     
     # Return user and token
-    return AuthResponse(
-        user=UserResponse.from_orm(user).dict(),
-        token=token
-    )
+    return ORJSONResponse({"user": _user_payload(user), "token": token.model_dump()})
 
 
 @router.get("/me", response_model=UserResponse)
@@ -71,7 +87,7 @@ def get_current_user_info(
     
     Returns the profile of the currently logged-in user.
     """
-    return UserResponse.from_orm(current_user)
+    return ORJSONResponse(_user_payload(current_user))
 
 
 @router.put("/me", response_model=UserResponse)
@@ -86,4 +102,4 @@ def update_current_user(
     Allows user to update their name and avatar URL.
     """
     updated_user = auth_service.update_user(db, current_user.id, user_data)
-    return UserResponse.from_orm(updated_user)
+    return ORJSONResponse(_user_payload(updated_user))
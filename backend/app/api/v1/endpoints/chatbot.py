@@ -5,7 +5,8 @@ from uuid import UUID
 
 from app.core.database import get_db
 from app.schemas.chatbot import (
-    ChatbotRequest, ChatbotResponse, ConfirmExpenseRequest, ClarifyRequest
+    ChatbotRequest, ChatbotResponse, ConfirmExpenseRequest, ClarifyRequest,
+    ParticipantSearchRequest, FindCommonGroupsRequest, CreateGroupExpenseRequest
 )
 from app.services import chatbot_service
 from app.services.expense_service import create_expense
@@ -194,3 +195,98 @@ def get_example_inputs():
             "Be as specific as possible for better parsing"
         ]
     }
+
+
+# Participant workflow
+
+@router.post("/search-participants")
+def search_participants(
+    request: ParticipantSearchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Search for users by participant names.
+    Returns users with emails for disambiguation.
+    """
+    users = chatbot_service.search_users_by_names(db, request.participant_names)
+    return {"users": users}
+
+
+@router.post("/find-groups")
+def find_common_groups_endpoint(
+    request: FindCommonGroupsRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Find groups containing current user and all participants.
+    """
+    groups = chatbot_service.find_common_groups(db, current_user.id, request.participant_ids)
+    return {"common_groups": groups}
+
+
+@router.post("/create-group-expense")
+def create_group_expense_from_chat(
+    request: CreateGroupExpenseRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Create group expense from chatbot conversation.
+    """
+    try:
+        # Build splits based on split type
+        splits = []
+        participant_ids = request.participant_ids
+        
+        if request.split_type == SplitType.EQUAL:
+            # Equal split among all participants
+            for pid in participant_ids:
+                splits.append(ExpenseSplitInput(
+                    user_id=pid,
+                    share_amount=None,
+                    share_percentage=None
+                ))
+        elif request.split_type == SplitType.EXACT:
+            # Exact amounts provided
+            for pid, amount in zip(participant_ids, request.amounts):
+                splits.append(ExpenseSplitInput(
+                    user_id=pid,
+                    share_amount=amount,
+                    share_percentage=None
+                ))
+        elif request.split_type == SplitType.PERCENTAGE:
+            # Percentages provided
+            for pid, pct in zip(participant_ids, request.percentages):
+                splits.append(ExpenseSplitInput(
+                    user_id=pid,
+                    share_amount=None,
+                    share_percentage=pct
+                ))
+        
+        # Create expense
+        expense_create = ExpenseCreate(
+            amount=request.amount,
+            description=request.description,
+            category=request.category,
+            expense_date=request.expense_date,
+            group_id=request.group_id,
+            split_type=request.split_type,
+            is_personal=False,
+            paid_by=current_user.id,
+            splits=splits
+        )
+        
+        expense = create_expense(db, expense_create, current_user.id)
+        
+        return {
+            "success": True,
+            "expense_id": str(expense.id),
+            "message": "Group expense created successfully!"
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create group expense: {str(e)}"
+        )
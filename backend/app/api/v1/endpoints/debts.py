@@ -1,25 +1,31 @@
 """Settlement and debt API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from sqlalchemy import func, case, and_, or_
+from sqlalchemy.orm import Session, joinedload, raiseload
+from typing import List, Optional
 from uuid import UUID
 
+from app.core.cache import cache_per_user
 from app.core.database import get_db
 from app.schemas.settlement import (
     SettlementCreate, SettlementResponse, GroupDebtSummary,
     DebtBalanceResponse
 )
 from app.services import settlement_service
-from app.utils.dependencies import get_current_user
+from app.utils.dependencies import get_current_user, verify_group_membership
+from app.utils.pagination import page_info
 from app.models.user import User
-from app.models.group import Group
+from app.models.group import Group, GroupMember
 from app.models.debt_balance import DebtBalance
+from app.models.settlement import Settlement
 
 router = APIRouter(prefix="/debts", tags=["Debts & Settlements"])
 
 
 @router.get("/groups/{group_id}/summary", response_model=GroupDebtSummary)
+@cache_per_user()
 def get_group_debt_summary(
+    request: Request,
     group_id: UUID,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -54,26 +60,24 @@ def get_group_debt_balances(
     Useful for detailed debt tracking.
     """
     # Verify user is a member
-    from app.models.group import GroupMember
-    membership = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.user_id == current_user.id
-    ).first()
-    
-    if not membership:
+    if not verify_group_membership(db, group_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this group"
         )
     
-    # Get all debt balances
-    debts = db.query(DebtBalance).filter(DebtBalance.group_id == group_id).all()
+    # Get all debt balances with both users joined in
+    debts = db.query(DebtBalance).options(
+        joinedload(DebtBalance.debtor),
+        joinedload(DebtBalance.creditor),
+        raiseload("*")
+    ).filter(DebtBalance.group_id == group_id).all()
     
     # Build responses with user names
     responses = []
     for debt in debts:
-        from_user = db.query(User).filter(User.id == debt.user_from).first()
-        to_user = db.query(User).filter(User.id == debt.user_to).first()
+        from_user = debt.debtor
+        to_user = debt.creditor
         
         responses.append(DebtBalanceResponse(
             id=debt.id,
@@ -104,24 +108,15 @@ def create_settlement(
     """
     settlement = settlement_service.create_settlement(db, settlement_data, current_user.id)
     
-    # Build response with names
-    group = db.query(Group).filter(Group.id == settlement.group_id).first()
-    payer = db.query(User).filter(User.id == settlement.payer_id).first()
-    receiver = db.query(User).filter(User.id == settlement.receiver_id).first()
-    
-    return SettlementResponse(
-        id=settlement.id,
-        group_id=settlement.group_id,
-        group_name=group.name if group else "Unknown",
-        payer_id=settlement.payer_id,
-        payer_name=payer.name if payer else "Unknown",
-        receiver_id=settlement.receiver_id,
-        receiver_name=receiver.name if receiver else "Unknown",
-        amount=settlement.amount,
-        settlement_date=settlement.date,
-        notes=settlement.notes,
-        created_at=settlement.created_at
-    )
+    # Reload with group, payer and receiver joined in for the response names
+    settlement = db.query(Settlement).options(
+        joinedload(Settlement.group),
+        joinedload(Settlement.payer),
+        joinedload(Settlement.receiver),
+        raiseload("*")
+    ).filter(Settlement.id == settlement.id).one()
+    
+    return settlement_service.build_settlement_response(settlement)
 
 
 @router.get("/groups/{group_id}/settlements", response_model=dict)
@@ -129,6 +124,8 @@ def get_group_settlements(
     group_id: UUID,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
+    include_count: bool = Query(False, description="Also count the total on cursor pages"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -136,45 +133,24 @@ def get_group_settlements(
     Get settlement history for a group.
     
     Returns all recorded settlements (debt payments) with pagination.
+    Pass the returned next_cursor back as cursor to page without OFFSET;
+    cursor pages skip the total count unless include_count is set.
     """
-    settlements, total_count = settlement_service.get_group_settlements(
-        db, group_id, current_user.id, page, limit
+    settlements, total_count, next_cursor = settlement_service.get_group_settlements(
+        db, group_id, current_user.id, page, limit, cursor, include_count
     )
     
-    # Build responses
-    settlement_responses = []
-    for settlement in settlements:
-        group = db.query(Group).filter(Group.id == settlement.group_id).first()
-        payer = db.query(User).filter(User.id == settlement.payer_id).first()
-        receiver = db.query(User).filter(User.id == settlement.receiver_id).first()
-        
-        settlement_responses.append(SettlementResponse(
-            id=settlement.id,
-            group_id=settlement.group_id,
-            group_name=group.name if group else "Unknown",
-            payer_id=settlement.payer_id,
-            payer_name=payer.name if payer else "Unknown",
-            receiver_id=settlement.receiver_id,
-            receiver_name=receiver.name if receiver else "Unknown",
-            amount=settlement.amount,
-            settlement_date=settlement.date,
-            notes=settlement.notes,
-            created_at=settlement.created_at
-        ))
-    
+    # Group, payer and receiver are batch-loaded by the service
     return {
-        "data": settlement_responses,
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total_count": total_count,
-            "total_pages": (total_count + limit - 1) // limit
-        }
+        "data": [settlement_service.build_settlement_response(settlement) for settlement in settlements],
+        "pagination": page_info(page, limit, total_count, next_cursor)
     }
 
 
 @router.get("/my-summary", response_model=dict)
+@cache_per_user()
 def get_my_debt_summary(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -187,41 +163,47 @@ def get_my_debt_summary(
     - Net balance across all groups
     - Breakdown by group
     """
-    from app.models.group import GroupMember
-    
-    # Get all groups user is a member of
-    memberships = db.query(GroupMember).filter(
-        GroupMember.user_id == current_user.id
+    uid = current_user.id
+    
+    # One grouped query: every group the user belongs to, with the debts
+    # owed to and by the user summed in SQL (groups without debts sum to 0)
+    rows = db.query(
+        GroupMember.group_id,
+        Group.name,
+        func.coalesce(
+            func.sum(case((DebtBalance.user_to == uid, DebtBalance.amount), else_=0)), 0
+        ).label("owed_to_me"),
+        func.coalesce(
+            func.sum(case((DebtBalance.user_from == uid, DebtBalance.amount), else_=0)), 0
+        ).label("i_owe")
+    ).join(
+        Group, Group.id == GroupMember.group_id
+    ).outerjoin(
+        DebtBalance,
+        and_(
+            DebtBalance.group_id == GroupMember.group_id,
+            or_(DebtBalance.user_to == uid, DebtBalance.user_from == uid)
+        )
+    ).filter(
+        GroupMember.user_id == uid
+    ).group_by(
+        GroupMember.group_id, Group.name
     ).all()
     
     total_owed_to_me = 0.0
     total_i_owe = 0.0
     group_summaries = []
     
-    for membership in memberships:
-        # Get debts where user receives money
-        owed_to_me = db.query(DebtBalance).filter(
-            DebtBalance.group_id == membership.group_id,
-            DebtBalance.user_to == current_user.id
-        ).all()
-        
-        # Get debts where user owes money
-        i_owe = db.query(DebtBalance).filter(
-            DebtBalance.group_id == membership.group_id,
-            DebtBalance.user_from == current_user.id
-        ).all()
-        
-        group_owed_to_me = sum(debt.amount for debt in owed_to_me)
-        group_i_owe = sum(debt.amount for debt in i_owe)
+    for group_id, group_name, owed_to_me, i_owe in rows:
+        group_owed_to_me = float(owed_to_me)
+        group_i_owe = float(i_owe)
         
         total_owed_to_me += group_owed_to_me
         total_i_owe += group_i_owe
         
-        group = db.query(Group).filter(Group.id == membership.group_id).first()
-        
         group_summaries.append({
-            "group_id": membership.group_id,
-            "group_name": group.name if group else "Unknown",
+            "group_id": group_id,
+            "group_name": group_name,
             "owed_to_me": group_owed_to_me,
             "i_owe": group_i_owe,
             "net_balance": group_owed_to_me - group_i_owe
@@ -1,10 +1,12 @@
 """Expense API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import inspect, select, union
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 from datetime import date
 
+from app.core.cache import cache_per_user, etag_per_user
 from app.core.database import get_db
 from app.schemas.expense import (
     ExpenseCreate, ExpenseUpdate, ExpenseResponse, ExpenseListResponse,
@@ -12,9 +14,9 @@ from app.schemas.expense import (
 )
 from app.services import expense_service
 from app.utils.dependencies import get_current_user
+from app.utils.pagination import page_info
 from app.models.user import User
 from app.models.expense import ExpenseSplit
-from app.models.group import Group
 
 router = APIRouter(prefix="/expenses", tags=["Expenses"])
 
@@ -42,7 +44,10 @@ def create_expense(
 
 
 @router.get("", response_model=dict)
+@etag_per_user
 def list_expenses(
+    request: Request,
+    response: Response,
     group_id: Optional[UUID] = Query(None),
     category: Optional[str] = Query(None),
     start_date: Optional[date] = Query(None),
@@ -54,6 +59,8 @@ def list_expenses(
     max_amount: Optional[float] = Query(None, ge=0),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
+    include_count: bool = Query(False, description="Also count the total on cursor pages"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -61,8 +68,10 @@ def list_expenses(
     Get expenses with filtering and pagination.
     
     Returns expenses where the current user is involved (creator, payer, or in splits).
+    Pass the returned next_cursor back as cursor to page without OFFSET;
+    cursor pages skip the total count unless include_count is set.
     """
-    expenses, total_count = expense_service.get_expenses(
+    expenses, total_count, next_cursor = expense_service.get_expenses(
         db=db,
         user_id=current_user.id,
         group_id=group_id,
@@ -75,53 +84,24 @@ def list_expenses(
         min_amount=min_amount,
         max_amount=max_amount,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=cursor,
+        include_count=include_count
     )
     
-    # Build list responses
-    expense_responses = []
-    for expense in expenses:
-        # Get payer name
-        payer = db.query(User).filter(User.id == expense.paid_by).first()
-        payer_name = payer.name if payer else "Unknown"
-        
-        # Get group name if applicable
-        group_name = None
-        if expense.group_id:
-            group = db.query(Group).filter(Group.id == expense.group_id).first()
-            group_name = group.name if group else None
-        
-        # Get split count
-        split_count = db.query(ExpenseSplit).filter(ExpenseSplit.expense_id == expense.id).count()
-        
-        expense_responses.append(ExpenseListResponse(
-            id=expense.id,
-            amount=expense.amount,
-            description=expense.description,
-            category=expense.category,
-            date=expense.date,
-            is_personal=expense.is_personal,
-            group_id=expense.group_id,
-            group_name=group_name,
-            paid_by=expense.paid_by,
-            payer_name=payer_name,
-            split_count=split_count,
-            created_at=expense.created_at
-        ))
-    
+    # Payer and group are loaded with the page, split counts are stored
+    # on the expense
     return {
-        "data": expense_responses,
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total_count": total_count,
-            "total_pages": (total_count + limit - 1) // limit
-        }
+        "data": [_build_expense_list_item(expense) for expense in expenses],
+        "pagination": page_info(page, limit, total_count, next_cursor)
     }
 
 
 @router.get("/{expense_id}", response_model=ExpenseResponse)
+@etag_per_user
 def get_expense_details(
+    request: Request,
+    response: Response,
     expense_id: UUID,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -169,7 +149,9 @@ def delete_expense(
 
 
 @router.get("/categories/list", response_model=List[str])
+@cache_per_user(ttl=300)
 def get_expense_categories(
+    request: Request,
     group_id: Optional[UUID] = Query(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -177,56 +159,49 @@ def get_expense_categories(
     """
     Get list of unique expense categories.
     
-    Useful for category filters and autocomplete.
+    Useful for category filters and autocomplete. Cached per user and
+    dropped whenever one of their expenses changes.
     """
     from app.models.expense import Expense
     
-    query = db.query(Expense.category).distinct().filter(
-        Expense.category.isnot(None),
-        (Expense.created_by == current_user.id) |
-        (Expense.paid_by == current_user.id) |
-        (Expense.id.in_(
-            db.query(ExpenseSplit.expense_id).filter(ExpenseSplit.user_id == current_user.id)
-        ))
-    )
+    # One leg per way of being involved, each an index scan; UNION removes
+    # duplicate categories instead of OR-ing a subquery into one scan
+    uid = current_user.id
+    created = select(Expense.category).where(Expense.created_by == uid)
+    paid = select(Expense.category).where(Expense.paid_by == uid)
+    shared = select(Expense.category).join(
+        ExpenseSplit, ExpenseSplit.expense_id == Expense.id
+    ).where(ExpenseSplit.user_id == uid)
     
     if group_id:
-        query = query.filter(Expense.group_id == group_id)
+        created = created.where(Expense.group_id == group_id)
+        paid = paid.where(Expense.group_id == group_id)
+        shared = shared.where(Expense.group_id == group_id)
     
-    categories = [cat[0] for cat in query.all() if cat[0]]
-    return sorted(categories)
+    categories = db.execute(union(created, paid, shared)).scalars().all()
+    return sorted(category for category in categories if category)
 
 
 def build_expense_response(db: Session, expense) -> ExpenseResponse:
     """Helper function to build expense response with all details."""
-    # Get creator name
-    creator = db.query(User).filter(User.id == expense.created_by).first()
-    creator_name = creator.name if creator else "Unknown"
+    # Reload with creator, payer, group and split users unless the service
+    # already did (expenses returned after a commit are expired)
+    if inspect(expense).unloaded & {"creator", "payer", "group", "splits"}:
+        expense = expense_service.load_expense_with_details(db, expense.id)
     
-    # Get payer name
-    payer = db.query(User).filter(User.id == expense.paid_by).first()
-    payer_name = payer.name if payer else "Unknown"
-    
-    # Get group name if applicable
-    group_name = None
-    if expense.group_id:
-        group = db.query(Group).filter(Group.id == expense.group_id).first()
-        group_name = group.name if group else None
-    
-    # Get splits with user names
-    splits_data = db.query(ExpenseSplit, User).join(
-        User, ExpenseSplit.user_id == User.id
-    ).filter(
-        ExpenseSplit.expense_id == expense.id
-    ).all()
+    creator_name = expense.creator.name if expense.creator else "Unknown"
+    payer_name = expense.payer.name if expense.payer else "Unknown"
+    group_name = expense.group.name if expense.group else None
     
+    total = float(expense.amount)
     splits = []
-    for split, user in splits_data:
+    for split in expense.splits:
+        share_amount = float(split.share_amount)
         splits.append(ExpenseSplitResponse(
-            user_id=user.id,
-            user_name=user.name,
-            share_amount=split.share_amount,
-            share_percentage=split.share_percentage
+            user_id=split.user.id,
+            user_name=split.user.name,
+            share_amount=share_amount,
+            share_percentage=round(share_amount / total * 100, 2)
         ))
     
     return ExpenseResponse(
@@ -246,3 +221,22 @@ def build_expense_response(db: Session, expense) -> ExpenseResponse:
         created_at=expense.created_at,
         updated_at=expense.updated_at
     )
+
+
+def _build_expense_list_item(expense) -> ExpenseListResponse:
+    """Build an expense list item from an expense with loaded payer and group."""
+    # Values come straight from the database, skip validation
+    return ExpenseListResponse.model_construct(
+        id=expense.id,
+        amount=float(expense.amount),
+        description=expense.description,
+        category=expense.category,
+        date=expense.date,
+        is_personal=expense.is_personal,
+        group_id=expense.group_id,
+        group_name=expense.group.name if expense.group else None,
+        paid_by=expense.paid_by,
+        payer_name=expense.payer.name if expense.payer else "Unknown",
+        split_count=expense.split_count,
+        created_at=expense.created_at
+    )
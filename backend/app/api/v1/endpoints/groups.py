@@ -1,9 +1,10 @@
 """Group API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from app.core.cache import etag_per_user
 from app.core.database import get_db
 from app.schemas.group import (
     GroupCreate, GroupUpdate, GroupResponse, GroupDetailResponse,
@@ -11,8 +12,9 @@ from app.schemas.group import (
 )
 from app.services import group_service
 from app.utils.dependencies import get_current_user
+from app.utils.pagination import page_info
 from app.models.user import User
-from app.models.group import GroupMember
+from app.models.group import Group
 
 router = APIRouter(prefix="/groups", tags=["Groups"])
 
@@ -29,26 +31,19 @@ def create_group(
     The current user will be added as the group owner.
     Other members can be added via member_ids (they will receive invitations).
     """
-    group = group_service.create_group(db, group_data, current_user.id)
-    
-    # Get member count
-    member_count = db.query(GroupMember).filter(GroupMember.group_id == group.id).count()
-    
-    return GroupResponse(
-        id=group.id,
-        name=group.name,
-        description=group.description,
-        created_by=group.created_by,
-        member_count=member_count,
-        created_at=group.created_at,
-        updated_at=group.updated_at
-    )
+    group, member_count = group_service.create_group(db, group_data, current_user.id)
+    return _build_group_response(group, member_count)
 
 
 @router.get("", response_model=dict)
+@etag_per_user
 def list_user_groups(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
+    include_count: bool = Query(False, description="Also count the total on cursor pages"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -56,36 +51,27 @@ def list_user_groups(
     Get all groups that the current user is a member of.
     
     Returns paginated list of groups with member counts.
+    Pass the returned next_cursor back as cursor to page without OFFSET;
+    cursor pages skip the total count unless include_count is set.
     """
-    groups, total_count = group_service.get_user_groups(db, current_user.id, page, limit)
+    groups, total_count, next_cursor = group_service.get_user_groups(
+        db, current_user.id, page, limit, cursor, include_count
+    )
     
-    # Build response with member counts
-    group_responses = []
-    for group in groups:
-        member_count = db.query(GroupMember).filter(GroupMember.group_id == group.id).count()
-        group_responses.append(GroupResponse(
-            id=group.id,
-            name=group.name,
-            description=group.description,
-            created_by=group.created_by,
-            member_count=member_count,
-            created_at=group.created_at,
-            updated_at=group.updated_at
-        ))
+    # Member counts come from one query for the whole page
+    member_counts = group_service.get_member_counts(db, [g.id for g in groups])
     
     return {
-        "data": group_responses,
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total_count": total_count,
-            "total_pages": (total_count + limit - 1) // limit
-        }
+        "data": [_build_group_response(group, member_counts.get(group.id, 0)) for group in groups],
+        "pagination": page_info(page, limit, total_count, next_cursor)
     }
 
 
 @router.get("/{group_id}", response_model=GroupDetailResponse)
+@etag_per_user
 def get_group_details(
+    request: Request,
+    response: Response,
     group_id: UUID,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -96,17 +82,12 @@ def get_group_details(
     Includes full member list with roles and user information.
     User must be a member of the group to access this endpoint.
     """
+    # Creator, members and member users are loaded with the group
     group = group_service.get_group_details(db, group_id, current_user.id)
     
-    # Get all members with user details
-    members_data = db.query(GroupMember, User).join(
-        User, GroupMember.user_id == User.id
-    ).filter(
-        GroupMember.group_id == group_id
-    ).all()
-    
     members = []
-    for membership, user in members_data:
+    for membership in group.members:
+        user = membership.user
         members.append(GroupMemberResponse(
             user_id=user.id,
             name=user.name,
@@ -116,9 +97,7 @@ def get_group_details(
             joined_at=membership.joined_at
         ))
     
-    # Get creator name
-    creator = db.query(User).filter(User.id == group.created_by).first()
-    creator_name = creator.name if creator else "Unknown"
+    creator_name = group.creator.name if group.creator else "Unknown"
     
     # Get member count
     member_count = len(members)
@@ -148,20 +127,8 @@ def update_group(
     
     Only the group owner can update the group.
     """
-    group = group_service.update_group(db, group_id, current_user.id, update_data)
-    
-    # Get member count
-    member_count = db.query(GroupMember).filter(GroupMember.group_id == group.id).count()
-    
-    return GroupResponse(
-        id=group.id,
-        name=group.name,
-        description=group.description,
-        created_by=group.created_by,
-        member_count=member_count,
-        created_at=group.created_at,
-        updated_at=group.updated_at
-    )
+    group, member_count = group_service.update_group(db, group_id, current_user.id, update_data)
+    return _build_group_response(group, member_count)
 
 
 @router.delete("/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -201,17 +168,11 @@ def add_member_to_group(
         member_data.user_id
     )
     
-    # Get group and inviter names
-    group = db.query(User).filter(User.id == invitation.group_id).first()
-    inviter = db.query(User).filter(User.id == invitation.inviter_id).first()
-    from app.models.group import Group
-    group_obj = db.query(Group).filter(Group.id == invitation.group_id).first()
-    
     return InvitationResponse(
         id=invitation.id,
         group_id=invitation.group_id,
-        group_name=group_obj.name if group_obj else "Unknown",
-        inviter_name=inviter.name if inviter else "Unknown",
+        group_name=invitation.group.name if invitation.group else "Unknown",
+        inviter_name=invitation.inviter.name if invitation.inviter else "Unknown",
         invitee_email=invitation.invitee_email,
         status=invitation.status.value,
         token=invitation.token,
@@ -264,20 +225,8 @@ def accept_group_invitation(
     
     The invitation token is provided in the invitation email/link.
     """
-    group = group_service.accept_invitation(db, token, current_user.id)
-    
-    # Get member count
-    member_count = db.query(GroupMember).filter(GroupMember.group_id == group.id).count()
-    
-    return GroupResponse(
-        id=group.id,
-        name=group.name,
-        description=group.description,
-        created_by=group.created_by,
-        member_count=member_count,
-        created_at=group.created_at,
-        updated_at=group.updated_at
-    )
+    group, member_count = group_service.accept_invitation(db, token, current_user.id)
+    return _build_group_response(group, member_count)
 
 
 @router.get("/invitations/pending", response_model=List[InvitationResponse])
@@ -289,25 +238,25 @@ def get_pending_invitations(
     Get all pending invitations for the current user.
     """
     from app.models.invitation import Invitation, InvitationStatus
-    from app.models.group import Group
-    from datetime import datetime
     
-    invitations = db.query(Invitation).filter(
+    # Group and inviter are joined in so the whole list is one query
+    rows = db.query(Invitation, Group.name, User.name).join(
+        Group, Group.id == Invitation.group_id
+    ).join(
+        User, User.id == Invitation.inviter_id
+    ).filter(
         ((Invitation.invitee_id == current_user.id) | (Invitation.invitee_email == current_user.email)),
         Invitation.status == InvitationStatus.PENDING,
-        Invitation.expires_at > datetime.utcnow()
+        ~Invitation.is_expired
     ).all()
     
     result = []
-    for invitation in invitations:
-        group = db.query(Group).filter(Group.id == invitation.group_id).first()
-        inviter = db.query(User).filter(User.id == invitation.inviter_id).first()
-        
+    for invitation, group_name, inviter_name in rows:
         result.append(InvitationResponse(
             id=invitation.id,
             group_id=invitation.group_id,
-            group_name=group.name if group else "Unknown",
-            inviter_name=inviter.name if inviter else "Unknown",
+            group_name=group_name,
+            inviter_name=inviter_name,
             invitee_email=invitation.invitee_email,
             status=invitation.status.value,
             token=invitation.token,
@@ -316,3 +265,17 @@ def get_pending_invitations(
         ))
     
     return result
+
+
+def _build_group_response(group: Group, member_count: int) -> GroupResponse:
+    """Build a group response from a group and its member count."""
+    # Values come straight from the database, skip validation
+    return GroupResponse.model_construct(
+        id=group.id,
+        name=group.name,
+        description=group.description,
+        created_by=group.created_by,
+        member_count=member_count,
+        created_at=group.created_at,
+        updated_at=group.updated_at
+    )
@@ -1,18 +1,22 @@
 """Settlement API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.orm import Session, aliased, raiseload, selectinload
+from typing import List, Optional
 from uuid import UUID
 
+from app.core.cache import etag_per_user
 from app.core.database import get_db
 from app.schemas.settlement import (
     SettlementCreate, SettlementResponse
 )
 from app.services import settlement_service
 from app.utils.dependencies import get_current_user
+from app.utils.pagination import page_info, paginate
 from app.models.user import User
 from app.models.group import Group, GroupMember
 from app.models.debt_balance import DebtBalance
+from app.models.settlement import Settlement
 
 router = APIRouter(prefix="/settlements", tags=["Settlements"])
 
@@ -32,54 +36,78 @@ def get_debt_summary(
     - Breakdown by group with individual debts
     """
     # Get all groups user is a member of
-    memberships = db.query(GroupMember).filter(
-        GroupMember.user_id == current_user.id
-    ).all()
+    group_ids = [
+        group_id for (group_id,) in db.query(GroupMember.group_id).filter(
+            GroupMember.user_id == current_user.id
+        )
+    ]
+    
+    # All debts involving the user across those groups in one query, as
+    # plain column rows (no ORM entities needed for a read-only summary)
+    debts = db.query(
+        DebtBalance.id,
+        DebtBalance.group_id,
+        DebtBalance.user_from,
+        DebtBalance.user_to,
+        DebtBalance.amount
+    ).filter(
+        DebtBalance.group_id.in_(group_ids),
+        or_(DebtBalance.user_to == current_user.id, DebtBalance.user_from == current_user.id)
+    ).all() if group_ids else []
+    
+    # Resolve group and counterpart names in bulk
+    group_names = dict(
+        db.query(Group.id, Group.name).filter(Group.id.in_(group_ids))
+    ) if group_ids else {}
+    other_user_ids = {
+        debt.user_from if debt.user_to == current_user.id else debt.user_to
+        for debt in debts
+    }
+    user_names = dict(
+        db.query(User.id, User.name).filter(User.id.in_(other_user_ids))
+    ) if other_user_ids else {}
+    
+    debts_by_group = {}
+    for debt in debts:
+        debts_by_group.setdefault(debt.group_id, []).append(debt)
     
     total_owed_to_me = 0.0
     total_i_owe = 0.0
     all_debts = []
     
-    for membership in memberships:
-        # Get debts where user receives money
-        owed_to_me = db.query(DebtBalance).filter(
-            DebtBalance.group_id == membership.group_id,
-            DebtBalance.user_to == current_user.id
-        ).all()
-        
-        # Get debts where user owes money
-        i_owe = db.query(DebtBalance).filter(
-            DebtBalance.group_id == membership.group_id,
-            DebtBalance.user_from == current_user.id
-        ).all()
-        
-        group = db.query(Group).filter(Group.id == membership.group_id).first()
+    for group_id in group_ids:
+        group_debts = debts_by_group.get(group_id, [])
+        group_name = group_names.get(group_id, "Unknown")
         
         # Add debts where others owe me
-        for debt in owed_to_me:
-            other_user = db.query(User).filter(User.id == debt.user_from).first()
-            total_owed_to_me += float(debt.amount)
+        for debt in group_debts:
+            if debt.user_to != current_user.id:
+                continue
+            amount = float(debt.amount)
+            total_owed_to_me += amount
             all_debts.append({
                 "id": str(debt.id),
                 "group_id": str(debt.group_id),
-                "group_name": group.name if group else "Unknown",
+                "group_name": group_name,
                 "other_user_id": str(debt.user_from),
-                "other_user_name": other_user.name if other_user else "Unknown",
-                "amount": float(debt.amount),  # Positive - they owe me
+                "other_user_name": user_names.get(debt.user_from, "Unknown"),
+                "amount": amount,  # Positive - they owe me
                 "type": "owed_to_me"
             })
         
         # Add debts where I owe others
-        for debt in i_owe:
-            other_user = db.query(User).filter(User.id == debt.user_to).first()
-            total_i_owe += float(debt.amount)
+        for debt in group_debts:
+            if debt.user_from != current_user.id:
+                continue
+            amount = float(debt.amount)
+            total_i_owe += amount
             all_debts.append({
                 "id": str(debt.id),
                 "group_id": str(debt.group_id),
-                "group_name": group.name if group else "Unknown",
+                "group_name": group_name,
                 "other_user_id": str(debt.user_to),
-                "other_user_name": other_user.name if other_user else "Unknown",
-                "amount": -float(debt.amount),  # Negative - I owe them
+                "other_user_name": user_names.get(debt.user_to, "Unknown"),
+                "amount": -amount,  # Negative - I owe them
                 "type": "i_owe"
             })
     
@@ -108,19 +136,27 @@ def record_settlement(
     """
     settlement = settlement_service.create_settlement(db, settlement_data, current_user.id)
     
-    # Build response with names
-    group = db.query(Group).filter(Group.id == settlement.group_id).first()
-    payer = db.query(User).filter(User.id == settlement.payer_id).first()
-    receiver = db.query(User).filter(User.id == settlement.receiver_id).first()
+    # Fetch the group, payer and receiver names for the response in one query
+    Payer = aliased(User)
+    Receiver = aliased(User)
+    group_name, payer_name, receiver_name = db.query(
+        Group.name, Payer.name, Receiver.name
+    ).select_from(Settlement).outerjoin(
+        Group, Group.id == Settlement.group_id
+    ).outerjoin(
+        Payer, Payer.id == Settlement.payer_id
+    ).outerjoin(
+        Receiver, Receiver.id == Settlement.receiver_id
+    ).filter(Settlement.id == settlement.id).one()
     
     return SettlementResponse(
         id=settlement.id,
         group_id=settlement.group_id,
-        group_name=group.name if group else "Unknown",
+        group_name=group_name or "Unknown",
         payer_id=settlement.payer_id,
-        payer_name=payer.name if payer else "Unknown",
+        payer_name=payer_name or "Unknown",
         receiver_id=settlement.receiver_id,
-        receiver_name=receiver.name if receiver else "Unknown",
+        receiver_name=receiver_name or "Unknown",
         amount=settlement.amount,
         settlement_date=settlement.date,
         notes=settlement.notes,
@@ -132,6 +168,8 @@ def record_settlement(
 def get_settlement_history(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
+    include_count: bool = Query(False, description="Also count the total on cursor pages"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -139,56 +177,43 @@ def get_settlement_history(
     Get settlement history across all groups for the current user.
     
     Returns all recorded settlements (debt payments) with pagination.
+    Pass the returned next_cursor back as cursor to page without OFFSET;
+    cursor pages skip the total count unless include_count is set.
     """
-    from app.models.settlement import Settlement
-    
-    # Get all groups user is a member of
-    memberships = db.query(GroupMember).filter(
+    # Groups user is a member of
+    group_ids = db.query(GroupMember.group_id).filter(
         GroupMember.user_id == current_user.id
-    ).all()
-    
-    group_ids = [m.group_id for m in memberships]
-    
-    # Get settlements for all user's groups
-    query = db.query(Settlement).filter(Settlement.group_id.in_(group_ids))
-    total_count = query.count()
-    
-    settlements = query.order_by(Settlement.date.desc()).offset((page - 1) * limit).limit(limit).all()
-    
-    # Build responses
-    settlement_responses = []
-    for settlement in settlements:
-        group = db.query(Group).filter(Group.id == settlement.group_id).first()
-        payer = db.query(User).filter(User.id == settlement.payer_id).first()
-        receiver = db.query(User).filter(User.id == settlement.receiver_id).first()
-        
-        settlement_responses.append(SettlementResponse(
-            id=settlement.id,
-            group_id=settlement.group_id,
-            group_name=group.name if group else "Unknown",
-            payer_id=settlement.payer_id,
-            payer_name=payer.name if payer else "Unknown",
-            receiver_id=settlement.receiver_id,
-            receiver_name=receiver.name if receiver else "Unknown",
-            amount=settlement.amount,
-            settlement_date=settlement.date,
-            notes=settlement.notes,
-            created_at=settlement.created_at
-        ))
+    ).scalar_subquery()
+    
+    # Load groups, payers and receivers for the whole page with one IN query each
+    query = db.query(Settlement).options(
+        selectinload(Settlement.group),
+        selectinload(Settlement.payer),
+        selectinload(Settlement.receiver),
+        raiseload("*")
+    ).filter(Settlement.group_id.in_(group_ids))
+    
+    # Most recent first
+    settlements, total_count, next_cursor = paginate(
+        query,
+        (Settlement.date, Settlement.created_at, Settlement.id),
+        page,
+        limit,
+        cursor,
+        include_count
+    )
     
     return {
-        "data": settlement_responses,
-        "pagination": {
-            "page": page,
-            "limit": limit,
-            "total_count": total_count,
-            "total_pages": (total_count + limit - 1) // limit
-        }
+        "data": [settlement_service.build_settlement_response(settlement) for settlement in settlements],
+        "pagination": page_info(page, limit, total_count, next_cursor)
     }
 
 
 @router.get("/optimize", response_model=dict)
+@etag_per_user
 def get_optimized_settlements(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -197,8 +222,11 @@ def get_optimized_settlements(
     
     Returns minimized debt transactions using a greedy algorithm.
     """
-    # Get all groups user is a member of
-    memberships = db.query(GroupMember).filter(
+    # Get all groups user is a member of, loading the groups in one query
+    memberships = db.query(GroupMember).options(
+        selectinload(GroupMember.group),
+        raiseload("*")
+    ).filter(
         GroupMember.user_id == current_user.id
     ).all()
     
@@ -209,7 +237,7 @@ def get_optimized_settlements(
             db, membership.group_id, current_user.id
         )
         
-        group = db.query(Group).filter(Group.id == membership.group_id).first()
+        group = membership.group
         
         optimized_by_group.append({
             "group_id": str(membership.group_id),
@@ -224,7 +252,10 @@ def get_optimized_settlements(
 
 
 @router.get("/my-simplified", response_model=dict)
+@etag_per_user
 def get_my_simplified_debts(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -237,8 +268,11 @@ def get_my_simplified_debts(
     
     These are the smart-simplified transactions across all groups.
     """
-    # Get all groups user is a member of
-    memberships = db.query(GroupMember).filter(
+    # Get all groups user is a member of, loading the groups in one query
+    memberships = db.query(GroupMember).options(
+        selectinload(GroupMember.group),
+        raiseload("*")
+    ).filter(
         GroupMember.user_id == current_user.id
     ).all()
     
@@ -252,7 +286,7 @@ def get_my_simplified_debts(
             db, membership.group_id, current_user.id
         )
         
-        group = db.query(Group).filter(Group.id == membership.group_id).first()
+        group = membership.group
         group_name = group.name if group else "Unknown"
         
         # Filter simplified debts involving current user
@@ -309,57 +343,56 @@ def get_debt_details_with_user(
     
     Returns debts across all shared groups.
     """
-    # Find all groups where both users are members
-    current_user_groups = db.query(GroupMember).filter(
-        GroupMember.user_id == current_user.id
-    ).all()
-    
-    other_user_groups = db.query(GroupMember).filter(
-        GroupMember.user_id == user_id
+    # Find all groups where both users are members, with their names
+    OtherMember = aliased(GroupMember)
+    shared_groups = db.query(GroupMember.group_id, Group.name).join(
+        OtherMember, OtherMember.group_id == GroupMember.group_id
+    ).join(
+        Group, Group.id == GroupMember.group_id
+    ).filter(
+        GroupMember.user_id == current_user.id,
+        OtherMember.user_id == user_id
     ).all()
     
-    current_group_ids = {m.group_id for m in current_user_groups}
-    other_group_ids = {m.group_id for m in other_user_groups}
-    shared_group_ids = current_group_ids & other_group_ids
-    
-    if not shared_group_ids:
+    if not shared_groups:
         return {
             "user_id": str(user_id),
             "shared_groups": [],
             "total_balance": 0.0
         }
     
-    # Get debts in shared groups
+    # Net balance per shared group, summed in the database
+    # (positive - other user owes current user)
+    group_balances = dict(
+        db.query(
+            DebtBalance.group_id,
+            func.sum(case(
+                (DebtBalance.user_from == user_id, DebtBalance.amount),
+                else_=-DebtBalance.amount
+            ))
+        ).filter(
+            DebtBalance.group_id.in_([group_id for group_id, _ in shared_groups]),
+            or_(
+                and_(DebtBalance.user_from == user_id, DebtBalance.user_to == current_user.id),
+                and_(DebtBalance.user_from == current_user.id, DebtBalance.user_to == user_id)
+            )
+        ).group_by(DebtBalance.group_id).all()
+    )
+    
     debts_info = []
     total_balance = 0.0
     
-    for group_id in shared_group_ids:
-        # Debts where other user owes current user
-        owed_to_me = db.query(DebtBalance).filter(
-            DebtBalance.group_id == group_id,
-            DebtBalance.user_from == user_id,
-            DebtBalance.user_to == current_user.id
-        ).all()
-        
-        # Debts where current user owes other user
-        i_owe = db.query(DebtBalance).filter(
-            DebtBalance.group_id == group_id,
-            DebtBalance.user_from == current_user.id,
-            DebtBalance.user_to == user_id
-        ).all()
-        
-        group_balance = sum(d.amount for d in owed_to_me) - sum(d.amount for d in i_owe)
+    for group_id, group_name in shared_groups:
+        group_balance = float(group_balances.get(group_id, 0))
         total_balance += group_balance
         
-        group = db.query(Group).filter(Group.id == group_id).first()
-        
         debts_info.append({
             "group_id": str(group_id),
-            "group_name": group.name if group else "Unknown",
+            "group_name": group_name,
             "balance": group_balance
         })
     
-    other_user = db.query(User).filter(User.id == user_id).first()
+    other_user = db.get(User, user_id)
     
     return {
         "user_id": str(user_id),
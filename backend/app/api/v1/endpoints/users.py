@@ -8,7 +8,6 @@ from app.schemas.user_search import UserSearchResult, InvitationResponse
 from app.services import user_search_service
 from app.utils.dependencies import get_current_user
 from app.models.user import User
-from app.models.group import Group
 
 router = APIRouter(prefix="/users", tags=["User Search & Invitations"])
 
@@ -51,18 +50,15 @@ def get_pending_invitations(
     """
     invitations = user_search_service.get_pending_invitations_for_user(db, current_user.id)
     
-    # Build responses with group and inviter details
+    # Build responses with group and inviter details (loaded with the invitations)
     responses = []
     for invitation in invitations:
-        group = db.query(Group).filter(Group.id == invitation.group_id).first()
-        inviter = db.query(User).filter(User.id == invitation.inviter_id).first()
-        
         responses.append(InvitationResponse(
             id=invitation.id,
             group_id=invitation.group_id,
-            group_name=group.name if group else "Unknown",
+            group_name=invitation.group.name if invitation.group else "Unknown",
             inviter_id=invitation.inviter_id,
-            inviter_name=inviter.name if inviter else "Unknown",
+            inviter_name=invitation.inviter.name if invitation.inviter else "Unknown",
             invitee_email=invitation.invitee_email,
             status=invitation.status,
             token=invitation.token,
@@ -85,15 +81,13 @@ def get_sent_invitations(
     """
     invitations = user_search_service.get_sent_invitations(db, current_user.id)
     
-    # Build responses
+    # Build responses (groups are loaded with the invitations)
     responses = []
     for invitation in invitations:
-        group = db.query(Group).filter(Group.id == invitation.group_id).first()
-        
         responses.append(InvitationResponse(
             id=invitation.id,
             group_id=invitation.group_id,
-            group_name=group.name if group else "Unknown",
+            group_name=invitation.group.name if invitation.group else "Unknown",
             inviter_id=invitation.inviter_id,
             inviter_name=current_user.name,
             invitee_email=invitation.invitee_email,
@@ -104,3 +98,4 @@ def get_sent_invitations(
         ))
     
     return responses
+
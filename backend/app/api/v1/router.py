@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, groups, expenses, debts, settlements, analytics, activity, chatbot, chatbot_participants, users
+from app.api.v1.endpoints import auth, groups, expenses, debts, settlements, analytics, activity, chatbot, users
 
 api_router = APIRouter()
 
@@ -24,11 +24,8 @@ api_router.include_router(analytics.router)
 # Include activity feed routes
 api_router.include_router(activity.router)
 
-# Include AI chatbot routes
+# Include AI chatbot routes (parsing and participant workflow)
 api_router.include_router(chatbot.router)
 
 # Include user search and invitations routes
-api_router.include_router(users.router)
-
-# Include chatbot participant workflow routes
-api_router.include_router(chatbot_participants.router)
\ No newline at end of file
+api_router.include_router(users.router)
\ No newline at end of file
@@ -0,0 +1,352 @@
+"""
+Per-user response cache with automatic invalidation on writes.
+
+Cached payloads are stored under ``resp:{user_id}:{generation}:...`` keys.
+Whenever a session commits changes to users, expenses, settlements, debts,
+groups, memberships or activity, every user affected by those rows
+(including all members of the touched groups) has their generation number
+bumped, so their old entries are never read again and simply expire. As the
+generation lives in Redis, shared by every worker, readers never see data
+older than their own last write.
+
+The generation also drives ETags, so a matching If-None-Match is answered
+without touching the database.
+
+Caching needs REDIS_URL. Without it there is nothing all workers could
+invalidate together, so nothing is cached and no ETags are issued.
+"""
+import functools
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Callable, Iterable, Optional, Set
+from uuid import UUID
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging_config import LOGGER_NAME
+from app.models.activity_log import ActivityLog
+from app.models.debt_balance import DebtBalance
+from app.models.expense import Expense, ExpenseSplit
+from app.models.group import Group, GroupMember
+from app.models.settlement import Settlement
+from app.models.user import User
+
+DEFAULT_TTL_SECONDS = 60
+
+# A slow Redis must not hold requests up for longer than the database would
+REDIS_TIMEOUT_SECONDS = 0.5
+
+logger = logging.getLogger(f"{LOGGER_NAME}.cache")
+
+
+class RedisCacheBackend:
+    """
+    Redis-backed cache shared by all workers.
+
+    Redis errors are logged and swallowed: lookups report a miss (or no
+    generation) so callers compute the value uncached, and failed writes
+    are skipped. An outage degrades to uncached responses, never to errors.
+    """
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(
+            url,
+            decode_responses=True,
+            socket_timeout=REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_TIMEOUT_SECONDS
+        )
+        self._error = redis.RedisError
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self._client.get(key)
+        except self._error:
+            logger.warning("Cache read failed for %s", key, exc_info=True)
+            return None
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        try:
+            self._client.set(key, value, ex=ttl)
+        except self._error:
+            logger.warning("Cache write failed for %s", key, exc_info=True)
+
+    def generation(self, key: str) -> Optional[str]:
+        """Return the counter under key, seeding it if it does not exist, or None if Redis fails."""
+        try:
+            value = self._client.get(key)
+            if value is None:
+                # Seed from the clock rather than 0, so a counter that was evicted
+                # never restarts at a number its old entries were stored under
+                self._client.set(key, time.time_ns(), nx=True)
+                value = self._client.get(key)
+            return value
+        except self._error:
+            logger.warning("Cache generation read failed for %s", key, exc_info=True)
+            return None
+
+    def bump_generations(self, keys: Iterable[str]) -> None:
+        """Increment every counter in one round trip, seeding missing ones."""
+        keys = list(keys)
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key in keys:
+                pipe.set(key, time.time_ns(), nx=True)
+                pipe.incr(key)
+            pipe.execute()
+        except self._error:
+            # Runs after the commit, so raising would fail a write that
+            # succeeded; the stale entries expire within their TTL instead
+            logger.error("Cache invalidation failed for %d users", len(keys), exc_info=True)
+
+
+cache_backend = RedisCacheBackend(settings.REDIS_URL) if settings.REDIS_URL else None
+
+# Whether responses are cached at all (see the module docstring)
+CACHE_ENABLED = cache_backend is not None
+
+
+def _generation_key(user_id: UUID) -> str:
+    return f"resp-gen:{user_id}"
+
+
+def user_generation(user_id: UUID) -> Optional[str]:
+    """Return the user's current data generation, or None when nothing can be cached."""
+    if not CACHE_ENABLED:
+        return None
+    return cache_backend.generation(_generation_key(user_id))
+
+
+def cached_value(
+    user_id: UUID,
+    name: str,
+    compute: Callable[[], Any],
+    ttl: int = DEFAULT_TTL_SECONDS,
+    refresh: bool = False,
+    generation: Optional[str] = None
+) -> Any:
+    """
+    Return a cached per-user value, computing it on a miss.
+
+    Values are keyed by the user's generation, so they are invalidated
+    together with the user's cached responses whenever related rows change.
+    Without a shared cache, or while Redis is unavailable, the value is
+    computed on every call.
+
+    Args:
+        user_id: Owner of the cached value
+        name: Key of the value within the user's namespace
+        compute: Builds the value when it is not cached
+        ttl: Time to live in seconds
+        refresh: Skip the lookup and recompute the value
+        generation: The user's generation, if the caller already read it
+
+    Returns:
+        JSON-compatible value
+    """
+    if generation is None:
+        generation = user_generation(user_id)
+    if generation is None:
+        return jsonable_encoder(compute())
+
+    key = f"resp:{user_id}:{generation}:{name}"
+
+    if not refresh:
+        cached = cache_backend.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+    value = jsonable_encoder(compute())
+    cache_backend.set(key, json.dumps(value), ttl)
+    return value
+
+
+def cached_response(
+    request: Request,
+    user_id: UUID,
+    compute: Callable[[], Any],
+    ttl: int = DEFAULT_TTL_SECONDS
+) -> Any:
+    """
+    Return the cached payload for this user and URL, computing it on a miss.
+
+    A ``Cache-Control: no-cache`` request header skips the lookup and
+    refreshes the entry.
+
+    Args:
+        request: Incoming request (path and query string form the key)
+        user_id: Owner of the cached payload
+        compute: Builds the payload when it is not cached
+        ttl: Time to live in seconds
+
+    Returns:
+        JSON-compatible payload
+    """
+    return cached_value(
+        user_id,
+        f"{request.url.path}?{request.url.query}",
+        compute,
+        ttl,
+        refresh="no-cache" in request.headers.get("cache-control", "")
+    )
+
+
+def cache_per_user(ttl: int = DEFAULT_TTL_SECONDS):
+    """
+    Cache a GET endpoint's response per user and URL.
+
+    The decorated endpoint must declare ``request: Request`` and
+    ``current_user`` parameters.
+
+    Args:
+        ttl: Time to live in seconds
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            return cached_response(
+                kwargs["request"],
+                kwargs["current_user"].id,
+                lambda: endpoint(*args, **kwargs),
+                ttl
+            )
+        return wrapper
+    return decorator
+
+
+def etag_per_user(endpoint: Callable) -> Callable:
+    """
+    Answer conditional GETs with 304 Not Modified while the user's data is unchanged.
+
+    The ETag combines the URL with the user's data generation, which changes
+    whenever a commit touches rows affecting the user, so a matching
+    If-None-Match needs no database work. Without a shared cache, or while
+    Redis is unavailable, the endpoint always runs and no ETag is sent. The decorated endpoint must
+    declare ``request: Request``, ``response: Response`` and
+    ``current_user`` parameters.
+    """
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        # Read the generation before computing, so a concurrent write leaves
+        # this ETag stale rather than the response
+        version = user_generation(kwargs["current_user"].id)
+        if version is None:
+            return endpoint(*args, **kwargs)
+
+        request = kwargs["request"]
+        digest = hashlib.blake2b(
+            f"{version}:{request.url.path}?{request.url.query}".encode(), digest_size=8
+        ).hexdigest()
+        etag = f'"{digest}"'
+
+        client_etags = request.headers.get("if-none-match", "")
+        if etag in (tag.strip().removeprefix("W/") for tag in client_etags.split(",")):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        result = endpoint(*args, **kwargs)
+        response = result if isinstance(result, Response) else kwargs["response"]
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+        return result
+    return wrapper
+
+
+def invalidate_users(user_ids: Iterable[UUID]) -> None:
+    """Retire every cached response of the given users by bumping their generations."""
+    if CACHE_ENABLED:
+        cache_backend.bump_generations(_generation_key(user_id) for user_id in set(user_ids))
+
+
+# Automatic invalidation
+#
+# Rows of these models change what cached responses show. For each one we
+# collect the users it names directly and the group it belongs to. Before
+# the flush (so deleted rows are still visible) we then resolve the members
+# of those groups, the co-members of changed users (who see their name), and
+# the split participants of changed expenses (splits are deleted passively,
+# so they are never loaded). All of them are invalidated once the
+# transaction commits.
+
+_USER_COLUMNS = {
+    Expense: ("created_by", "paid_by"),
+    ExpenseSplit: ("user_id",),
+    Settlement: ("payer_id", "receiver_id"),
+    DebtBalance: ("user_from", "user_to"),
+    GroupMember: ("user_id",),
+    ActivityLog: ("user_id",),
+    Group: ("created_by",),
+    User: ("id",),
+}
+
+
+def invalidate_on_commit(session: Session, user_ids: Iterable[UUID]) -> None:
+    """
+    Drop the given users' cached responses once the session commits.
+
+    Needed for rows written with Core statements, which bypass the flush
+    hooks below.
+    """
+    session.info.setdefault("cache_invalidate_users", set()).update(user_ids)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_affected_users(session: Session, flush_context, instances) -> None:
+    user_ids: Set[UUID] = set()
+    group_ids: Set[UUID] = set()
+    expense_ids: Set[UUID] = set()
+    changed_user_ids: Set[UUID] = set()
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        columns = _USER_COLUMNS.get(type(obj))
+        if columns is None:
+            continue
+        user_ids.update(getattr(obj, column) for column in columns)
+        group_id = obj.id if isinstance(obj, Group) else getattr(obj, "group_id", None)
+        if group_id is not None:
+            group_ids.add(group_id)
+        # New expenses have no id or splits in the database yet
+        if isinstance(obj, Expense) and obj.id is not None:
+            expense_ids.add(obj.id)
+        if isinstance(obj, User) and obj.id is not None:
+            changed_user_ids.add(obj.id)
+
+    if expense_ids:
+        participants = session.connection().execute(
+            select(ExpenseSplit.user_id).where(ExpenseSplit.expense_id.in_(expense_ids))
+        ).scalars()
+        user_ids.update(participants)
+
+    if changed_user_ids:
+        user_groups = session.connection().execute(
+            select(GroupMember.group_id).where(GroupMember.user_id.in_(changed_user_ids))
+        ).scalars()
+        group_ids.update(user_groups)
+
+    if group_ids:
+        members = session.connection().execute(
+            select(GroupMember.user_id).where(GroupMember.group_id.in_(group_ids))
+        ).scalars()
+        user_ids.update(members)
+
+    user_ids.discard(None)
+    if user_ids:
+        invalidate_on_commit(session, user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    user_ids = session.info.pop("cache_invalidate_users", None)
+    if user_ids:
+        invalidate_users(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop("cache_invalidate_users", None)
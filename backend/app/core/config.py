@@ -1,5 +1,5 @@
-from pydantic_settings import BaseSettings
-from typing import List
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -16,20 +16,24 @@ class Settings(BaseSettings):
     # OpenRouter API
     OPENROUTER_API_KEY: str
     
+    # Redis (optional) - enables the response cache, shared by all workers
+    REDIS_URL: Optional[str] = None
+    
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:5174"
     
     # Environment
     ENVIRONMENT: str = "development"
     
+    # Debug - counts SQL statements per request and warns about N+1 patterns
+    DEBUG: bool = False
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """Convert CORS_ORIGINS string to list."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
 
 settings = Settings()
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -7,8 +7,11 @@ from app.core.config import settings
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,  # Connection pool size
-    max_overflow=20  # Max overflow connections
+    pool_size=20,  # Connections kept open; covers typical concurrency without reconnecting
+    max_overflow=10,  # Extra short-lived connections for bursts
+    pool_recycle=1800,  # Replace connections before server/proxy idle timeouts drop them
+    query_cache_size=1200,  # Compiled statements kept; list filters combine into many shapes
+    executemany_mode="values_plus_batch"  # Send batched UPDATEs (e.g. debt balances) in pages, not row by row
 )
 
 # Create session factory
@@ -18,6 +21,11 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def utc_now():
+    """SQL expression for the current UTC time as a naive timestamp, like every DateTime column."""
+    return func.timezone("utc", func.now())
+
+
 def get_db():
     """Dependency to get database session."""
     db = SessionLocal()
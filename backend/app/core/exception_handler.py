@@ -1,15 +1,18 @@
 """Exception handlers for the application."""
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.core.exceptions import SplitlyException
-import traceback
+from app.core.logging_config import LOGGER_NAME
+import logging
+
+logger = logging.getLogger(f"{LOGGER_NAME}.errors")
 
 
 async def splitly_exception_handler(request: Request, exc: SplitlyException):
     """Handle custom Splitly exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -24,7 +27,7 @@ async def splitly_exception_handler(request: Request, exc: SplitlyException):
 
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -39,15 +42,16 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors."""
-    errors = []
-    for error in exc.errors():
-        errors.append({
-            "field": ".".join(str(loc) for loc in error["loc"]),
+    errors = [
+        {
+            "field": ".".join(map(str, error["loc"])),
             "message": error["msg"],
             "type": error["type"]
-        })
+        }
+        for error in exc.errors()
+    ]
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "success": False,
@@ -63,11 +67,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
-    # Log the error (in production, use proper logging)
-    print(f"Unexpected error: {exc}")
-    traceback.print_exc()
+    # Enqueue the error with its traceback; the log listener writes it out
+    logger.exception(
+        "Unexpected error handling %s %s", request.method, request.url.path,
+        exc_info=exc
+    )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
@@ -0,0 +1,46 @@
+"""Application logging setup."""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOGGER_NAME = "splitly"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route the ``splitly`` loggers through a queue drained by a background thread.
+    
+    Request handlers only enqueue records; writing them to stderr happens on
+    the listener thread, so logging never blocks a response on I/O.
+    
+    Args:
+        level: Minimum level for application loggers
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,12 +1,18 @@
 """Middleware for rate limiting and request tracking."""
 from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from collections import defaultdict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from collections import Counter, defaultdict
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+import logging
 import time
 
+from app.core.logging_config import LOGGER_NAME
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
@@ -39,7 +45,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         # Check rate limit
         if len(self.requests[client_ip]) >= self.requests_per_minute:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "detail": "Rate limit exceeded. Please try again later.",
@@ -89,3 +95,52 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         response.headers["X-Process-Time"] = f"{process_time:.3f}s"
         
         return response
+
+
+query_logger = logging.getLogger(f"{LOGGER_NAME}.queries")
+
+# Statements executed by the current request, keyed by SQL text
+_request_statements: ContextVar[Optional[Counter]] = ContextVar("request_statements", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    statements = _request_statements.get()
+    if statements is not None:
+        statements[statement] += 1
+
+
+class QueryCountMiddleware(BaseHTTPMiddleware):
+    """
+    Development-only guard against N+1 queries.
+    
+    Counts the SQL statements each request executes and reports the total
+    in an X-Query-Count header. When the same statement runs more than
+    repeat_threshold times in one request (the signature of a relationship
+    lazy-loaded per row) a warning naming the statement is logged.
+    """
+    
+    def __init__(self, app, repeat_threshold: int = 5):
+        super().__init__(app)
+        self.repeat_threshold = repeat_threshold
+    
+    async def dispatch(self, request: Request, call_next):
+        """Process request while counting its SQL statements."""
+        statements = Counter()
+        token = _request_statements.set(statements)
+        try:
+            response = await call_next(request)
+        finally:
+            _request_statements.reset(token)
+        
+        response.headers["X-Query-Count"] = str(sum(statements.values()))
+        
+        for statement, count in statements.most_common():
+            if count <= self.repeat_threshold:
+                break
+            query_logger.warning(
+                f"Possible N+1 in {request.method} {request.url.path}: "
+                f"statement ran {count} times: {' '.join(statement.split())[:200]}"
+            )
+        
+        return response
@@ -1,10 +1,14 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.core.config import settings
 from app.api.v1.router import api_router
-from app.core.middleware import RateLimitMiddleware, RequestLoggingMiddleware
+from app.core.middleware import RateLimitMiddleware, RequestLoggingMiddleware, QueryCountMiddleware
 from app.core.exception_handler import (
     splitly_exception_handler,
     http_exception_handler,
@@ -12,6 +16,50 @@ from app.core.exception_handler import (
     general_exception_handler
 )
 from app.core.exceptions import SplitlyException
+from app.core.database import SessionLocal
+from app.core.logging_config import LOGGER_NAME, setup_logging, shutdown_logging
+from app.services.group_service import expire_stale_invitations
+from app.services.openrouter_service import close_http_client
+
+
+setup_logging()
+logger = logging.getLogger(f"{LOGGER_NAME}.jobs")
+
+INVITATION_SWEEP_INTERVAL_SECONDS = 3600
+
+
+def _sweep_invitations() -> int:
+    """Expire stale invitations in a session of its own."""
+    db = SessionLocal()
+    try:
+        return expire_stale_invitations(db)
+    finally:
+        db.close()
+
+
+async def _expire_invitations_periodically():
+    """Run the invitation expiry sweep every hour, off the event loop."""
+    while True:
+        try:
+            expired = await asyncio.to_thread(_sweep_invitations)
+            if expired:
+                logger.info(f"Expired {expired} stale invitations")
+        except Exception:
+            logger.exception("Invitation expiry sweep failed")
+        await asyncio.sleep(INVITATION_SWEEP_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background jobs, and release shared resources on shutdown."""
+    sweeper = asyncio.create_task(_expire_invitations_periodically())
+    yield
+    sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await sweeper
+    await close_http_client()
+    shutdown_logging()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -19,7 +67,9 @@ app = FastAPI(
     description="Smart Expense & Debt Management System",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -39,6 +89,8 @@ app.add_middleware(
 # Add custom middleware
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(RateLimitMiddleware, requests_per_minute=60)
+if settings.DEBUG:
+    app.add_middleware(QueryCountMiddleware)
 
 # Register exception handlers
 app.add_exception_handler(SplitlyException, splitly_exception_handler)
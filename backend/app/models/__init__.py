@@ -3,6 +3,7 @@
 from app.models.user import User, UserRole
 from app.models.group import Group, GroupMember, GroupMemberRole
 from app.models.expense import Expense, ExpenseSplit
+from app.models.expense_history import ExpenseHistory
 from app.models.settlement import Settlement
 from app.models.debt_balance import DebtBalance
 from app.models.activity_log import ActivityLog, ActionType, EntityType
@@ -16,6 +17,7 @@ __all__ = [
     "GroupMemberRole",
     "Expense",
     "ExpenseSplit",
+    "ExpenseHistory",
     "Settlement",
     "DebtBalance",
     "ActivityLog",
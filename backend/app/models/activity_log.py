@@ -1,10 +1,8 @@
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Index
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Index, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, utc_now
 
 
 class ActionType(str, enum.Enum):
@@ -35,14 +33,15 @@ class ActivityLog(Base):
     """Activity log model (tracks all user and group activities)."""
     __tablename__ = "activity_logs"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     group_id = Column(UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=True)
     action_type = Column(SQLEnum(ActionType), nullable=False)
     entity_type = Column(SQLEnum(EntityType), nullable=False)
     entity_id = Column(UUID(as_uuid=True), nullable=False)
-    action_metadata = Column(JSON, nullable=True)  # Additional context about the action (renamed from metadata)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    action_metadata = Column(JSONB, nullable=True)  # Additional context about the action (renamed from metadata)
+    # Filled in by the database (UTC, like the other naive timestamps)
+    timestamp = Column(DateTime, server_default=utc_now(), nullable=False, index=True)
     
     # Relationships
     user = relationship("User", back_populates="activity_logs")
@@ -54,3 +53,7 @@ class ActivityLog(Base):
 
 # Create index on timestamp for efficient sorting
 Index('idx_activity_timestamp', ActivityLog.timestamp.desc())
+
+# Composite indexes backing keyset pagination of the user and group feeds
+Index('idx_activity_user_timestamp', ActivityLog.user_id, ActivityLog.timestamp.desc(), ActivityLog.id.desc())
+Index('idx_activity_group_timestamp', ActivityLog.group_id, ActivityLog.timestamp.desc(), ActivityLog.id.desc())
@@ -1,9 +1,8 @@
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, Numeric, DateTime, ForeignKey, CheckConstraint, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, CheckConstraint, UniqueConstraint, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, utc_now
+from app.models.types import Cents
 
 
 class DebtBalance(Base):
@@ -13,18 +12,21 @@ class DebtBalance(Base):
     """
     __tablename__ = "debt_balances"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     group_id = Column(UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
     user_from = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     user_to = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    amount = Column(Numeric(10, 2), nullable=False)
-    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    amount = Column(Cents, nullable=False)
+    last_updated = Column(DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
     
     # Constraints
     __table_args__ = (
         CheckConstraint('amount > 0', name='check_debt_amount_positive'),
         CheckConstraint('user_from != user_to', name='check_debt_different_users'),
         UniqueConstraint('group_id', 'user_from', 'user_to', name='uq_group_debt'),
+        # Covering indexes for per-group "owed to" / "owes" lookups
+        Index('idx_debt_group_user_to', 'group_id', 'user_to', postgresql_include=['amount']),
+        Index('idx_debt_group_user_from', 'group_id', 'user_from', postgresql_include=['amount']),
     )
     
     # Relationships
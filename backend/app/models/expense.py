@@ -1,17 +1,17 @@
-import uuid
-from datetime import datetime, date
-from sqlalchemy import Column, String, Numeric, Date, DateTime, Boolean, ForeignKey, CheckConstraint
+from datetime import date
+from sqlalchemy import Column, String, Integer, Date, DateTime, Boolean, ForeignKey, CheckConstraint, UniqueConstraint, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, utc_now
+from app.models.types import Cents
 
 
 class Expense(Base):
     """Expense model."""
     __tablename__ = "expenses"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    amount = Column(Numeric(10, 2), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    amount = Column(Cents, nullable=False)
     description = Column(String(200), nullable=False)
     category = Column(String(50), nullable=False)
     date = Column(Date, default=date.today, nullable=False)
@@ -19,8 +19,9 @@ class Expense(Base):
     group_id = Column(UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     paid_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    split_count = Column(Integer, default=0, server_default="0", nullable=False)  # Splits are written once, at creation
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
     
     # Constraints
     __table_args__ = (
@@ -28,10 +29,10 @@ class Expense(Base):
     )
     
     # Relationships
-    group = relationship("Group", back_populates="expenses")
-    creator = relationship("User", back_populates="created_expenses", foreign_keys=[created_by])
-    payer = relationship("User", back_populates="paid_expenses", foreign_keys=[paid_by])
-    splits = relationship("ExpenseSplit", back_populates="expense", cascade="all, delete-orphan")
+    group = relationship("Group", back_populates="expenses", lazy="raise_on_sql")
+    creator = relationship("User", back_populates="created_expenses", foreign_keys=[created_by], lazy="raise_on_sql")
+    payer = relationship("User", back_populates="paid_expenses", foreign_keys=[paid_by], lazy="raise_on_sql")
+    splits = relationship("ExpenseSplit", back_populates="expense", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Expense(id={self.id}, amount={self.amount}, description={self.description})>"
@@ -41,16 +42,17 @@ class ExpenseSplit(Base):
     """Expense split model (how an expense is divided among participants)."""
     __tablename__ = "expense_splits"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     expense_id = Column(UUID(as_uuid=True), ForeignKey("expenses.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    share_amount = Column(Numeric(10, 2), nullable=False)
-    share_percentage = Column(Numeric(5, 2), nullable=True)  # Optional, for percentage splits
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    share_amount = Column(Cents, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
     
     # Constraints
     __table_args__ = (
         CheckConstraint('share_amount >= 0', name='check_split_amount_non_negative'),
+        # One share per participant; also indexes splits by expense
+        UniqueConstraint('expense_id', 'user_id', name='uq_split_expense_user'),
     )
     
     # Relationships
@@ -59,3 +61,15 @@ class ExpenseSplit(Base):
     
     def __repr__(self):
         return f"<ExpenseSplit(expense_id={self.expense_id}, user_id={self.user_id}, amount={self.share_amount})>"
+
+
+# Lookups of a user's expenses by creator, payer and split participant, and
+# of a group's expenses; the date keeps filtered lists in sort order
+Index('idx_expense_created_by_date', Expense.created_by, Expense.date.desc())
+Index('idx_expense_paid_by_date', Expense.paid_by, Expense.date.desc(), postgresql_include=['amount'])
+Index('idx_expense_group_date', Expense.group_id, Expense.date.desc())
+Index('idx_expense_group_category_date', Expense.group_id, Expense.category, Expense.date.desc())
+Index('idx_expense_split_user_expense', ExpenseSplit.user_id, ExpenseSplit.expense_id)
+
+# Sort key of the expense list, backing its keyset pagination
+Index('idx_expense_date_created', Expense.date.desc(), Expense.created_at.desc(), Expense.id.desc())
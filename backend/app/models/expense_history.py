@@ -1,32 +1,32 @@
 """Expense history model for audit trail."""
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, utc_now
 
 
 class ExpenseHistory(Base):
     """
     Expense edit history for audit trail.
-    Tracks all changes made to expenses.
+    Tracks all changes made to expenses, one row per edit.
     """
     __tablename__ = "expense_history"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     expense_id = Column(UUID(as_uuid=True), ForeignKey("expenses.id", ondelete="CASCADE"), nullable=False)
     edited_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    edited_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    edited_at = Column(DateTime, server_default=utc_now(), nullable=False)
     
-    # Changed fields
-    field_changed = Column(String(50), nullable=False)  # 'amount', 'description', 'category', etc.
-    old_value = Column(String(500), nullable=True)
-    new_value = Column(String(500), nullable=True)
+    # Changed fields as {field: [old_value, new_value]}, e.g. {"amount": ["10.00", "12.50"]}
+    changes = Column(JSONB, nullable=False)
     
     # Relationships
     expense = relationship("Expense")
     editor = relationship("User")
     
     def __repr__(self):
-        return f"<ExpenseHistory(expense_id={self.expense_id}, field={self.field_changed}, edited_at={self.edited_at})>"
+        return f"<ExpenseHistory(expense_id={self.expense_id}, fields={list(self.changes or {})}, edited_at={self.edited_at})>"
+
+
+# Edits of one expense, newest first; also serves the ON DELETE CASCADE from expenses
+Index('idx_expense_history_expense_edited', ExpenseHistory.expense_id, ExpenseHistory.edited_at.desc())
@@ -1,10 +1,8 @@
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum as SQLEnum, UniqueConstraint, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, utc_now
 
 
 class GroupMemberRole(str, enum.Enum):
@@ -17,21 +15,22 @@ class Group(Base):
     """Group model."""
     __tablename__ = "groups"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
     
-    # Relationships
-    creator = relationship("User", back_populates="created_groups", foreign_keys=[created_by])
-    members = relationship("GroupMember", back_populates="group", cascade="all, delete-orphan")
-    expenses = relationship("Expense", back_populates="group", cascade="all, delete-orphan")
-    settlements = relationship("Settlement", back_populates="group", cascade="all, delete-orphan")
-    debt_balances = relationship("DebtBalance", back_populates="group", cascade="all, delete-orphan")
-    invitations = relationship("Invitation", back_populates="group", cascade="all, delete-orphan")
-    activity_logs = relationship("ActivityLog", back_populates="group", cascade="all, delete-orphan")
+    # Relationships (never lazy-loaded: queries must eager-load what they use,
+    # and child rows are removed by the ON DELETE CASCADE foreign keys)
+    creator = relationship("User", back_populates="created_groups", foreign_keys=[created_by], lazy="raise_on_sql")
+    members = relationship("GroupMember", back_populates="group", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    expenses = relationship("Expense", back_populates="group", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    settlements = relationship("Settlement", back_populates="group", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    debt_balances = relationship("DebtBalance", back_populates="group", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    invitations = relationship("Invitation", back_populates="group", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    activity_logs = relationship("ActivityLog", back_populates="group", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Group(id={self.id}, name={self.name})>"
@@ -41,16 +40,18 @@ class GroupMember(Base):
     """Group member model (junction table for users and groups)."""
     __tablename__ = "group_members"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     group_id = Column(UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     role = Column(SQLEnum(GroupMemberRole), default=GroupMemberRole.MEMBER, nullable=False)
-    joined_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    joined_at = Column(DateTime, server_default=utc_now(), nullable=False)
     invited_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
     # Unique constraint: user can only be in a group once
     __table_args__ = (
         UniqueConstraint('group_id', 'user_id', name='uq_group_user'),
+        # Reverse lookup: groups of a user
+        Index('idx_group_member_user_group', 'user_id', 'group_id'),
     )
     
     # Relationships
@@ -60,3 +61,7 @@ class GroupMember(Base):
     
     def __repr__(self):
         return f"<GroupMember(group_id={self.group_id}, user_id={self.user_id}, role={self.role})>"
+
+
+# Sort key of the user's group list, backing its keyset pagination
+Index('idx_group_created_at', Group.created_at.desc(), Group.id.desc())
@@ -1,10 +1,10 @@
-import uuid
-from datetime import datetime, timedelta
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Index
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 import enum
-from app.core.database import Base
+from app.core.database import Base, utc_now
 
 
 class InvitationStatus(str, enum.Enum):
@@ -19,7 +19,7 @@ class Invitation(Base):
     """Invitation model (for inviting users to groups)."""
     __tablename__ = "invitations"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     group_id = Column(UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
     inviter_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     invitee_email = Column(String(255), nullable=False)
@@ -27,8 +27,8 @@ class Invitation(Base):
     status = Column(SQLEnum(InvitationStatus), default=InvitationStatus.PENDING, nullable=False)
     token = Column(String(100), unique=True, nullable=False, index=True)
     expires_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
     
     # Relationships
     group = relationship("Group", back_populates="invitations")
@@ -38,11 +38,19 @@ class Invitation(Base):
     def __repr__(self):
         return f"<Invitation(id={self.id}, group_id={self.group_id}, invitee_email={self.invitee_email}, status={self.status})>"
     
-    @property
+    @hybrid_property
     def is_expired(self) -> bool:
         """Check if invitation has expired."""
         return datetime.utcnow() > self.expires_at
+    
+    @is_expired.expression
+    def is_expired(cls):
+        """Same check as SQL, so queries can filter on it."""
+        return cls.expires_at < utc_now()
 
 
-# Create index on token for fast lookup
-Index('idx_invitation_token', Invitation.token)
+# Token lookups use the unique index on the column itself. Pending-inbox
+# lookups match by invitee id or email; expiry sweeps scan pending rows by date
+Index('idx_invitation_invitee_status', Invitation.invitee_id, Invitation.status)
+Index('idx_invitation_email_status', Invitation.invitee_email, Invitation.status)
+Index('idx_invitation_status_expires', Invitation.status, Invitation.expires_at)
@@ -1,23 +1,23 @@
-import uuid
-from datetime import datetime, date
-from sqlalchemy import Column, Numeric, Date, DateTime, Text, ForeignKey, CheckConstraint
+from datetime import date
+from sqlalchemy import Column, Date, DateTime, Text, ForeignKey, CheckConstraint, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, utc_now
+from app.models.types import Cents
 
 
 class Settlement(Base):
     """Settlement model (records when someone pays back a debt)."""
     __tablename__ = "settlements"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     group_id = Column(UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
     payer_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     receiver_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    amount = Column(Numeric(10, 2), nullable=False)
+    amount = Column(Cents, nullable=False)
     date = Column(Date, default=date.today, nullable=False)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
     
     # Constraints
     __table_args__ = (
@@ -32,3 +32,7 @@ class Settlement(Base):
     
     def __repr__(self):
         return f"<Settlement(id={self.id}, payer_id={self.payer_id}, receiver_id={self.receiver_id}, amount={self.amount})>"
+
+
+# Composite index backing keyset pagination of group settlement history
+Index('idx_settlement_group_date', Settlement.group_id, Settlement.date.desc(), Settlement.created_at.desc(), Settlement.id.desc())
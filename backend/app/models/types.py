@@ -0,0 +1,28 @@
+"""Custom column types."""
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class Cents(TypeDecorator):
+    """
+    Money amount stored as a whole number of cents in a BIGINT column.
+
+    Python code keeps working with Decimal amounts (two decimal places):
+    values are converted to cents when bound and back when read, including
+    SUM/CASE expressions over the column, so aggregates run on integers in
+    the database.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        cents = (Decimal(str(value)) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+        return int(cents)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
@@ -1,10 +1,8 @@
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, utc_now
 
 
 class UserRole(str, enum.Enum):
@@ -17,24 +15,33 @@ class User(Base):
     """User model."""
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     name = Column(String(100), nullable=False)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     avatar_url = Column(String(500), nullable=True)
     role = Column(SQLEnum(UserRole), default=UserRole.USER, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
     
-    # Relationships
-    created_groups = relationship("Group", back_populates="creator", foreign_keys="Group.created_by")
-    group_memberships = relationship("GroupMember", back_populates="user", foreign_keys="GroupMember.user_id", cascade="all, delete-orphan")
-    created_expenses = relationship("Expense", back_populates="creator", foreign_keys="Expense.created_by")
-    paid_expenses = relationship("Expense", back_populates="payer", foreign_keys="Expense.paid_by")
-    expense_splits = relationship("ExpenseSplit", back_populates="user", cascade="all, delete-orphan")
-    sent_invitations = relationship("Invitation", back_populates="inviter", foreign_keys="Invitation.inviter_id")
-    received_invitations = relationship("Invitation", back_populates="invitee", foreign_keys="Invitation.invitee_id")
-    activity_logs = relationship("ActivityLog", back_populates="user", cascade="all, delete-orphan")
+    # Relationships (never lazy-loaded: queries must eager-load what they use,
+    # and child rows are removed by the ON DELETE CASCADE foreign keys)
+    created_groups = relationship("Group", back_populates="creator", foreign_keys="Group.created_by", lazy="raise_on_sql")
+    group_memberships = relationship("GroupMember", back_populates="user", foreign_keys="GroupMember.user_id", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    created_expenses = relationship("Expense", back_populates="creator", foreign_keys="Expense.created_by", lazy="raise_on_sql")
+    paid_expenses = relationship("Expense", back_populates="payer", foreign_keys="Expense.paid_by", lazy="raise_on_sql")
+    expense_splits = relationship("ExpenseSplit", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    sent_invitations = relationship("Invitation", back_populates="inviter", foreign_keys="Invitation.inviter_id", lazy="raise_on_sql")
+    received_invitations = relationship("Invitation", back_populates="invitee", foreign_keys="Invitation.invitee_id", lazy="raise_on_sql")
+    activity_logs = relationship("ActivityLog", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, name={self.name})>"
+
+
+# Trigram index so substring name searches (ILIKE '%name%') avoid a full scan
+Index(
+    'idx_user_name_trgm', User.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'}
+)
@@ -1,10 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import date
 from uuid import UUID
 
 
-class CategoryBreakdown(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CategoryBreakdown:
     """Breakdown of expenses by category."""
     category: str
     total_amount: float
@@ -12,7 +14,8 @@ class CategoryBreakdown(BaseModel):
     percentage: float
 
 
-class MonthlyTrend(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MonthlyTrend:
     """Monthly expense trend."""
     month: str  # Format: "2026-01"
     total_amount: float  # Changed from total_expenses
@@ -45,16 +48,45 @@ class GroupFinancialSummary(BaseModel):
     outstanding_debts: float
 
 
+class RecentExpense(BaseModel):
+    """Recent expense shown on the dashboard."""
+    id: UUID
+    amount: float
+    description: str
+    category: Optional[str]
+    expense_date: date = Field(alias="date")
+    payer_name: str
+    group_name: Optional[str]
+    
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class DashboardSummary(BaseModel):
     """Complete dashboard summary for a user."""
     user_summary: UserFinancialSummary
-    recent_expenses: List[dict]  # List of recent expense summaries
+    recent_expenses: List[RecentExpense]
     group_summaries: List[GroupFinancialSummary]
     category_breakdown: List[CategoryBreakdown]
     monthly_trends: List[MonthlyTrend]
     top_categories: List[CategoryBreakdown]  # Top 5 categories
 
 
+class MemberContribution(BaseModel):
+    """How much a member paid for a group."""
+    user_id: UUID
+    user_name: str
+    total_paid: float
+    expense_count: int
+    percentage: float
+
+
+class ActiveMember(BaseModel):
+    """Member who paid for the most group expenses."""
+    user_id: UUID
+    user_name: str
+    expense_count: int
+
+
 class GroupAnalytics(BaseModel):
     """Detailed analytics for a group."""
     group_id: UUID
@@ -67,11 +99,19 @@ class GroupAnalytics(BaseModel):
     smallest_expense: float
     category_breakdown: List[CategoryBreakdown]
     monthly_trends: List[MonthlyTrend]
-    member_contributions: List[Dict]  # Who paid what
-    most_active_member: Optional[Dict] = None  # user_id, user_name, expense_count
+    member_contributions: List[MemberContribution]  # Who paid what
+    most_active_member: Optional[ActiveMember] = None
+
+
+@dataclass(frozen=True, slots=True)
+class TrendPoint:
+    """Expense total for one period of a trend."""
+    period: str
+    amount: float
+    count: int
 
 
 class ExpenseTrend(BaseModel):
     """Expense trend over time."""
     period: str  # daily, weekly, monthly
-    data_points: List[Dict]  # {date/period, amount, count}
+    data_points: List[TrendPoint]
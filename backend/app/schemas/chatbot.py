@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import date
 from uuid import UUID
 
+from app.schemas.expense import SplitType
+
 
 class ChatbotRequest(BaseModel):
     """Request to parse expense from natural language."""
@@ -21,11 +24,11 @@ class ParsedExpense(BaseModel):
     confidence: float = Field(..., ge=0, le=1, description="Confidence score 0-1")
     missing_fields: List[str] = Field(default_factory=list, description="Fields that need clarification")
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
-class ParticipantMatch(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ParticipantMatch:
     """A single user match for a participant name."""
     user_id: UUID
     full_name: str
@@ -98,13 +101,37 @@ class ConfirmExpenseRequest(BaseModel):
     group_id: Optional[UUID] = None
     paid_by: UUID
     split_type: str = "equal"  # equal, exact, percentage
-    splits: List[Dict[str, Any]] = Field(..., min_items=1)
+    splits: List[Dict[str, Any]] = Field(..., min_length=1)
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ClarifyRequest(BaseModel):
     """Request to provide clarification."""
     session_id: str
     clarifications: Dict[str, Any]  # field -> value mapping
+
+
+class ParticipantSearchRequest(BaseModel):
+    """Request to search users by participant names."""
+    participant_names: List[str] = Field(default_factory=list)
+
+
+class FindCommonGroupsRequest(BaseModel):
+    """Request to find groups containing the current user and participants."""
+    participant_ids: List[UUID] = Field(default_factory=list)
+
+
+class CreateGroupExpenseRequest(BaseModel):
+    """Request to create a group expense from a chatbot conversation."""
+    amount: float = Field(..., gt=0)
+    description: str = Field(..., min_length=1)
+    category: str
+    expense_date: date = Field(default_factory=date.today, alias="date")
+    group_id: UUID
+    participant_ids: List[UUID] = Field(..., min_length=1)
+    split_type: SplitType
+    amounts: List[float] = Field(default_factory=list)  # For exact splits
+    percentages: List[float] = Field(default_factory=list)  # For percentage splits
+    
+    model_config = ConfigDict(populate_by_name=True)
@@ -1,10 +1,16 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic.dataclasses import dataclass
 from typing import Optional, List
 from datetime import datetime, date
 from uuid import UUID
 from enum import Enum
 
 
+def _to_hundredths(value: float) -> int:
+    """Convert an amount to whole cents (or a percentage to basis points)."""
+    return round(value * 100)
+
+
 class SplitType(str, Enum):
     """Types of expense splits."""
     EQUAL = "equal"
@@ -18,7 +24,8 @@ class ExpenseSplitInput(BaseModel):
     share_amount: Optional[float] = Field(None, ge=0)
     share_percentage: Optional[float] = Field(None, ge=0, le=100)
     
-    @validator('share_amount', 'share_percentage')
+    @field_validator('share_amount', 'share_percentage')
+    @classmethod
     def validate_split_values(cls, v):
         """Ensure split values are valid."""
         if v is not None and v < 0:
@@ -34,8 +41,7 @@ class ExpenseBase(BaseModel):
     expense_date: date = Field(default_factory=date.today, alias="date")
     is_personal: bool = False
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ExpenseCreate(ExpenseBase):
@@ -43,43 +49,41 @@ class ExpenseCreate(ExpenseBase):
     group_id: Optional[UUID] = None
     paid_by: UUID  # User who paid
     split_type: SplitType = SplitType.EQUAL
-    splits: List[ExpenseSplitInput] = Field(..., min_items=1)
+    splits: List[ExpenseSplitInput] = Field(..., min_length=1)
     
-    @validator('splits')
-    def validate_splits(cls, splits, values):
+    @model_validator(mode='after')
+    def validate_splits(self):
         """Validate splits based on split type."""
-        if 'split_type' not in values:
-            return splits
-            
-        split_type = values['split_type']
+        if len({split.user_id for split in self.splits}) != len(self.splits):
+            raise ValueError("Each participant can only appear once in splits")
         
-        if split_type == SplitType.EQUAL:
+        if self.split_type == SplitType.EQUAL:
             # For equal split, we don't need share amounts
-            return splits
+            return self
             
-        elif split_type == SplitType.EXACT:
+        elif self.split_type == SplitType.EXACT:
             # For exact split, all splits must have share_amount
-            for split in splits:
+            for split in self.splits:
                 if split.share_amount is None:
                     raise ValueError("All splits must have share_amount for exact split type")
             
-            # Verify total equals expense amount
-            total = sum(split.share_amount for split in splits)
-            if 'amount' in values and abs(total - values['amount']) > 0.01:
-                raise ValueError(f"Sum of splits ({total}) must equal total amount ({values['amount']})")
+            # Verify total equals expense amount, to the cent
+            total_cents = sum(_to_hundredths(split.share_amount) for split in self.splits)
+            if total_cents != _to_hundredths(self.amount):
+                raise ValueError(f"Sum of splits ({total_cents / 100:.2f}) must equal total amount ({self.amount})")
                 
-        elif split_type == SplitType.PERCENTAGE:
+        elif self.split_type == SplitType.PERCENTAGE:
             # For percentage split, all splits must have share_percentage
-            for split in splits:
+            for split in self.splits:
                 if split.share_percentage is None:
                     raise ValueError("All splits must have share_percentage for percentage split type")
             
-            # Verify percentages sum to 100
-            total_pct = sum(split.share_percentage for split in splits)
-            if abs(total_pct - 100) > 0.01:
-                raise ValueError(f"Sum of percentages ({total_pct}) must equal 100")
+            # Verify percentages sum to exactly 100 (in basis points)
+            total_bps = sum(_to_hundredths(split.share_percentage) for split in self.splits)
+            if total_bps != 10000:
+                raise ValueError(f"Sum of percentages ({total_bps / 100:.2f}) must equal 100")
         
-        return splits
+        return self
 
 
 class ExpenseUpdate(BaseModel):
@@ -89,19 +93,16 @@ class ExpenseUpdate(BaseModel):
     category: Optional[str] = Field(None, max_length=100)
     expense_date: Optional[date] = Field(None, alias="date")
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
-class ExpenseSplitResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ExpenseSplitResponse:
     """Schema for expense split response."""
     user_id: UUID
     user_name: str
     share_amount: float
-    share_percentage: Optional[float]
-    
-    class Config:
-        from_attributes = True
+    share_percentage: float  # Share of the expense total, derived from share_amount
 
 
 class ExpenseResponse(ExpenseBase):
@@ -117,8 +118,7 @@ class ExpenseResponse(ExpenseBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExpenseListResponse(BaseModel):
@@ -136,9 +136,7 @@ class ExpenseListResponse(BaseModel):
     split_count: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class ExpenseFilter(BaseModel):
@@ -153,10 +151,10 @@ class ExpenseFilter(BaseModel):
     min_amount: Optional[float] = Field(None, ge=0)
     max_amount: Optional[float] = Field(None, ge=0)
     
-    @validator('max_amount')
-    def validate_amount_range(cls, v, values):
+    @model_validator(mode='after')
+    def validate_amount_range(self):
         """Ensure max_amount >= min_amount."""
-        if v is not None and 'min_amount' in values and values['min_amount'] is not None:
-            if v < values['min_amount']:
+        if self.max_amount is not None and self.min_amount is not None:
+            if self.max_amount < self.min_amount:
                 raise ValueError("max_amount must be >= min_amount")
-        return v
+        return self
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
 from app.models.group import GroupMemberRole
+from app.schemas.settlement import SimplifiedDebt
 
 
 class GroupBase(BaseModel):
@@ -31,8 +33,7 @@ class GroupMemberResponse(BaseModel):
     role: GroupMemberRole
     joined_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GroupResponse(GroupBase):
@@ -43,8 +44,7 @@ class GroupResponse(GroupBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GroupDetailResponse(GroupResponse):
@@ -53,7 +53,8 @@ class GroupDetailResponse(GroupResponse):
     creator_name: str
 
 
-class DebtSummary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DebtSummary:
     """Schema for debt summary."""
     user_id: UUID
     user_name: str
@@ -67,17 +68,14 @@ class GroupDebtSummary(BaseModel):
     net_balance: float
     who_owes_you: List[DebtSummary]
     who_you_owe: List[DebtSummary]
-    simplified_debts: List[dict]  # Will contain {from, to, amount}
+    simplified_debts: List[SimplifiedDebt]
 
 
 class AddMemberRequest(BaseModel):
     """Schema for adding a member to a group."""
+    # At least one of user_id or email must be provided
     user_id: Optional[UUID] = None
     email: Optional[str] = None
-    
-    class Config:
-        # At least one of user_id or email must be provided
-        pass
 
 
 class InvitationResponse(BaseModel):
@@ -92,5 +90,4 @@ class InvitationResponse(BaseModel):
     expires_at: datetime
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
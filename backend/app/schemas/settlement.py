@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime, date
 from uuid import UUID
@@ -10,8 +10,7 @@ class SettlementBase(BaseModel):
     notes: Optional[str] = Field(None, max_length=500)
     settlement_date: date = Field(default_factory=date.today, alias="date")
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SettlementCreate(SettlementBase):
@@ -31,9 +30,7 @@ class SettlementResponse(SettlementBase):
     receiver_name: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class DebtSummaryItem(BaseModel):
@@ -84,5 +81,4 @@ class DebtBalanceResponse(BaseModel):
     amount: float
     last_updated: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
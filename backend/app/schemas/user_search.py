@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -12,8 +12,7 @@ class UserSearchResult(BaseModel):
     email: str
     avatar_url: Optional[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InvitationResponse(BaseModel):
@@ -29,8 +28,7 @@ class InvitationResponse(BaseModel):
     expires_at: datetime
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SendInvitationRequest(BaseModel):
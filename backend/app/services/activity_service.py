@@ -1,12 +1,17 @@
 """Activity logging service layer."""
-from sqlalchemy.orm import Session
-from typing import Optional, Dict, Any, List, Tuple
+from collections import defaultdict
+from sqlalchemy.orm import Session, selectinload, joinedload, raiseload
+from typing import Callable, Optional, Dict, Any, List, Set, Tuple
 from uuid import UUID
 from datetime import datetime
 
 from app.models.activity_log import ActivityLog, ActionType, EntityType
-from app.models.user import User
+from app.models.expense import Expense
 from app.models.group import Group, GroupMember
+from app.models.settlement import Settlement
+from app.models.user import User
+from app.utils.pagination import paginate
+from app.utils.dependencies import verify_group_membership
 from fastapi import HTTPException, status
 
 def log_activity(
@@ -55,8 +60,9 @@ def get_user_activity_feed(
     db: Session,
     user_id: UUID,
     page: int = 1,
-    limit: int = 20
-) -> Tuple[List[ActivityLog], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None
+) -> Tuple[List[ActivityLog], int, Optional[str]]:
     """
     Get activity feed for a user.
     
@@ -65,11 +71,12 @@ def get_user_activity_feed(
     Args:
         db: Database session
         user_id: User ID
-        page: Page number
+        page: Page number (ignored when a cursor is given)
         limit: Items per page
+        cursor: Optional keyset cursor from a previous page's next_cursor
         
     Returns:
-        Tuple of (activities list, total count)
+        Tuple of (activities list, total count, next cursor)
     """
     # Get all groups user is a member of
     user_groups = db.query(GroupMember.group_id).filter(
@@ -78,19 +85,22 @@ def get_user_activity_feed(
     
     group_ids = [g[0] for g in user_groups]
     
-    # Query activities from user's groups or user's personal activities
-    query = db.query(ActivityLog).filter(
+    # Query activities from user's groups or user's personal activities.
+    # User and group are eager-loaded so building the feed needs no per-row
+    # lookups; raiseload makes any other lazy access fail loudly.
+    query = db.query(ActivityLog).options(
+        selectinload(ActivityLog.user),
+        selectinload(ActivityLog.group),
+        raiseload("*")
+    ).filter(
         (ActivityLog.group_id.in_(group_ids)) |
         (ActivityLog.user_id == user_id)
     )
     
-    total_count = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * limit
-    activities = query.order_by(ActivityLog.timestamp.desc()).offset(offset).limit(limit).all()
-    
-    return activities, total_count
+    # Newest first; total count comes back with the page
+    return paginate(
+        query, (ActivityLog.timestamp, ActivityLog.id), page, limit, cursor, include_count=True
+    )
 
 
 def get_group_activity_feed(
@@ -98,8 +108,9 @@ def get_group_activity_feed(
     group_id: UUID,
     current_user_id: UUID,
     page: int = 1,
-    limit: int = 20
-) -> Tuple[List[ActivityLog], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None
+) -> Tuple[List[ActivityLog], int, Optional[str]]:
     """
     Get activity feed for a specific group.
     
@@ -107,86 +118,185 @@ def get_group_activity_feed(
         db: Database session
         group_id: Group ID
         current_user_id: Current user ID (must be member)
-        page: Page number
+        page: Page number (ignored when a cursor is given)
         limit: Items per page
+        cursor: Optional keyset cursor from a previous page's next_cursor
         
     Returns:
-        Tuple of (activities list, total count)
+        Tuple of (activities list, total count, next cursor)
     """
     
     # Verify user is a member
-    membership = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.user_id == current_user_id
-    ).first()
-    
-    if not membership:
+    if not verify_group_membership(db, group_id, current_user_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this group"
         )
     
-    # Query activities for this group
-    query = db.query(ActivityLog).filter(ActivityLog.group_id == group_id)
+    # Query activities for this group (user and group eager-loaded)
+    query = db.query(ActivityLog).options(
+        selectinload(ActivityLog.user),
+        selectinload(ActivityLog.group),
+        raiseload("*")
+    ).filter(ActivityLog.group_id == group_id)
     
-    total_count = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * limit
-    activities = query.order_by(ActivityLog.timestamp.desc()).offset(offset).limit(limit).all()
-    
-    return activities, total_count
+    # Newest first; total count comes back with the page
+    return paginate(
+        query, (ActivityLog.timestamp, ActivityLog.id), page, limit, cursor, include_count=True
+    )
+
+
+# Generic verb for each action type
+_ACTION_VERBS: Dict[ActionType, str] = {
+    ActionType.EXPENSE_CREATED: "created an expense",
+    ActionType.EXPENSE_UPDATED: "updated an expense",
+    ActionType.EXPENSE_DELETED: "deleted an expense",
+    ActionType.GROUP_CREATED: "created a group",
+    ActionType.GROUP_UPDATED: "updated a group",
+    ActionType.GROUP_DELETED: "deleted a group",
+    ActionType.MEMBER_ADDED: "added a member",
+    ActionType.MEMBER_REMOVED: "removed a member",
+    ActionType.MEMBER_JOINED: "joined",
+    ActionType.MEMBER_LEFT: "left",
+    ActionType.SETTLEMENT_CREATED: "settled a payment"
+}
 
+# Detailed messages for action types whose metadata says more, given
+# (user name, metadata)
+_MESSAGE_FORMATTERS: Dict[ActionType, Callable[[str, Dict[str, Any]], str]] = {
+    ActionType.EXPENSE_CREATED: lambda user_name, metadata: (
+        f"{user_name} created expense ${metadata.get('amount', '')}: {metadata.get('description', '')}"
+    ),
+    ActionType.GROUP_CREATED: lambda user_name, metadata: (
+        f"{user_name} created group \"{metadata.get('group_name', '')}\""
+    ),
+    ActionType.MEMBER_ADDED: lambda user_name, metadata: (
+        f"{user_name} added {metadata.get('member_name', '')} to the group"
+    ),
+    ActionType.SETTLEMENT_CREATED: lambda user_name, metadata: (
+        f"{user_name} settled ${metadata.get('amount', '')} with {metadata.get('receiver_name', '')}"
+    ),
+}
 
-def format_activity_message(activity: ActivityLog, db: Session) -> str:
+
+def format_activity_message(
+    activity: ActivityLog,
+    metadata: Optional[Dict[str, Any]] = None
+) -> str:
     """
     Format activity into human-readable message.
     
+    Expects ``activity.user`` to be eager-loaded (see the feed queries above).
+    
     Args:
         activity: Activity log entry
-        db: Database session
+        metadata: Optional metadata to use instead of ``activity.action_metadata``
         
     Returns:
         Formatted message string
     """
+    metadata = metadata or activity.action_metadata
+    
     # Get user name
-    user = db.query(User).filter(User.id == activity.user_id).first()
+    user = activity.user
     user_name = user.name if user else "Someone"
     
-    # Build message based on action and entity type
-    action_verb = {
-        ActionType.EXPENSE_CREATED: "created an expense",
-        ActionType.EXPENSE_UPDATED: "updated an expense",
-        ActionType.EXPENSE_DELETED: "deleted an expense",
-        ActionType.GROUP_CREATED: "created a group",
-        ActionType.GROUP_UPDATED: "updated a group",
-        ActionType.GROUP_DELETED: "deleted a group",
-        ActionType.MEMBER_ADDED: "added a member",
-        ActionType.MEMBER_REMOVED: "removed a member",
-        ActionType.MEMBER_JOINED: "joined",
-        ActionType.MEMBER_LEFT: "left",
-        ActionType.SETTLEMENT_CREATED: "settled a payment"
-    }.get(activity.action_type, "performed an action")
+    # Build message based on action type
+    formatter = _MESSAGE_FORMATTERS.get(activity.action_type)
+    if formatter and metadata:
+        return formatter(user_name, metadata)
+    
+    return f"{user_name} {_ACTION_VERBS.get(activity.action_type, 'performed an action')}"
+
+
+# Model of each entity type an activity can reference
+_ENTITY_MODELS = {
+    EntityType.EXPENSE: Expense,
+    EntityType.SETTLEMENT: Settlement,
+    EntityType.GROUP: Group,
+    EntityType.USER: User,
+}
+
+
+def load_activity_entities(
+    db: Session,
+    activities: List[ActivityLog]
+) -> Dict[Tuple[EntityType, UUID], Any]:
+    """
+    Batch-load the entities referenced by activities logged without metadata.
+    
+    Issues one ``SELECT ... WHERE id IN (...)`` per entity type for the
+    whole page, never one per row.
+    
+    Args:
+        db: Database session
+        activities: Activity log entries
+        
+    Returns:
+        Dictionary mapping (entity type, entity ID) to the loaded entity
+    """
+    entity_ids: Dict[EntityType, Set[UUID]] = defaultdict(set)
+    for activity in activities:
+        if not activity.action_metadata:
+            entity_ids[activity.entity_type].add(activity.entity_id)
+    
+    entity_cache: Dict[Tuple[EntityType, UUID], Any] = {}
+    for entity_type, ids in entity_ids.items():
+        model = _ENTITY_MODELS[entity_type]
+        query = db.query(model)
+        if model is Settlement:
+            query = query.options(joinedload(Settlement.receiver))
+        
+        for entity in query.filter(model.id.in_(ids)).all():
+            entity_cache[(entity_type, entity.id)] = entity
+    
+    return entity_cache
+
+
+def _entity_metadata(entity: Any) -> Dict[str, Any]:
+    """Rebuild message metadata, in the logged format, from an entity."""
+    if isinstance(entity, Expense):
+        return {"amount": float(entity.amount), "description": entity.description}
+    if isinstance(entity, Settlement):
+        return {"amount": float(entity.amount), "receiver_name": entity.receiver.name}
+    if isinstance(entity, Group):
+        return {"group_name": entity.name}
+    if isinstance(entity, User):
+        return {"member_name": entity.name}
+    return {}
+
+
+def format_activity_messages(
+    activities: List[ActivityLog],
+    entity_cache: Optional[Dict[Tuple[EntityType, UUID], Any]] = None
+) -> Dict[UUID, str]:
+    """
+    Format a page of activities into human-readable messages.
+    
+    Messages come from each activity's logged metadata. Entries logged
+    without metadata fall back to their entity in ``entity_cache`` (see
+    ``load_activity_entities``), so formatting never touches the database.
+    
+    Args:
+        activities: Activity log entries (``user`` eager-loaded)
+        entity_cache: Referenced entities keyed by (entity type, entity ID)
+        
+    Returns:
+        Dictionary mapping activity ID to formatted message
+    """
+    entity_cache = entity_cache or {}
+    messages = {}
     
-    message = user_name
-    if activity.action_type == ActionType.EXPENSE_CREATED and activity.action_metadata:
-        amount = activity.action_metadata.get("amount", "")
-        description = activity.action_metadata.get("description", "")
-        message = f"{user_name} created expense ${amount}: {description}"
-    elif activity.action_type == ActionType.GROUP_CREATED and activity.action_metadata:
-        group_name = activity.action_metadata.get("group_name", "")
-        message = f"{user_name} created group \"{group_name}\""
-    elif activity.action_type == ActionType.MEMBER_ADDED and activity.action_metadata:
-        member_name = activity.action_metadata.get("member_name", "")
-        message = f"{user_name} added {member_name} to the group"
-    elif activity.action_type == ActionType.SETTLEMENT_CREATED and activity.action_metadata:
-        amount = activity.action_metadata.get("amount", "")
-        receiver = activity.action_metadata.get("receiver_name", "")
-        message = f"{user_name} settled ${amount} with {receiver}"
-    else:
-        message = f"{user_name} {action_verb}"
+    for activity in activities:
+        # Logged metadata is kept as history; the entity's current values
+        # only stand in when nothing was logged
+        metadata = None
+        if not activity.action_metadata:
+            entity = entity_cache.get((activity.entity_type, activity.entity_id))
+            metadata = _entity_metadata(entity) if entity is not None else None
+        messages[activity.id] = format_activity_message(activity, metadata)
     
-    return message
+    return messages
 
 
 # Helper functions to log specific activities
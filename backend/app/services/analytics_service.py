@@ -1,6 +1,6 @@
 """Analytics and dashboard service layer."""
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func, extract, case
 from fastapi import HTTPException, status
 from typing import List, Dict, Optional, Tuple
 from uuid import UUID
@@ -9,9 +9,11 @@ from collections import defaultdict
 
 from app.models.user import User
 from app.models.group import Group, GroupMember
-from app.models.expense import Expense, ExpenseSplit
+from app.models.expense import Expense
 from app.models.settlement import Settlement
 from app.models.debt_balance import DebtBalance
+from app.services import expense_service, group_service
+from app.utils.dependencies import verify_group_membership
 
 
 def get_user_dashboard(
@@ -30,7 +32,7 @@ def get_user_dashboard(
     Returns:
         Complete dashboard data
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -41,28 +43,42 @@ def get_user_dashboard(
     end_date = date.today()
     start_date = end_date - timedelta(days=months * 30)
     
-    # Get all expenses user is involved in
-    user_expenses = db.query(Expense).filter(
-        (Expense.created_by == user_id) |
-        (Expense.paid_by == user_id) |
-        (Expense.id.in_(
-            db.query(ExpenseSplit.expense_id).filter(ExpenseSplit.user_id == user_id)
-        ))
-    ).all()
+    # Sum the user's expenses per month and category in the database; the
+    # totals, category breakdown and monthly trends are all rolled up from these
+    year = extract("year", Expense.date)
+    month = extract("month", Expense.date)
+    expense_buckets = db.query(
+        year.label("year"),
+        month.label("month"),
+        Expense.category,
+        func.sum(Expense.amount).label("total"),
+        func.sum(case((Expense.paid_by == user_id, Expense.amount), else_=0)).label("paid"),
+        func.count(Expense.id).label("count")
+    ).filter(
+        expense_service.user_expense_filter(user_id)
+    ).group_by(year, month, Expense.category).all()
     
     # Calculate totals
-    total_expenses = sum(float(exp.amount) for exp in user_expenses)
-    total_paid = sum(float(exp.amount) for exp in user_expenses if exp.paid_by == user_id)
+    total_expenses = sum(float(row.total) for row in expense_buckets)
+    total_paid = sum(float(row.paid) for row in expense_buckets)
+    expense_count = sum(row.count for row in expense_buckets)
     
     # Get debt balances
-    owed_to_user = db.query(DebtBalance).filter(DebtBalance.user_to == user_id).all()
-    user_owes = db.query(DebtBalance).filter(DebtBalance.user_from == user_id).all()
-    
-    total_owed_to_user = sum(float(debt.amount) for debt in owed_to_user)
-    total_user_owes = sum(float(debt.amount) for debt in user_owes)
-    
-    # Get group count
-    group_count = db.query(GroupMember).filter(GroupMember.user_id == user_id).count()
+    debt_totals = db.query(
+        func.coalesce(func.sum(case((DebtBalance.user_to == user_id, DebtBalance.amount), else_=0)), 0).label("owed_to_user"),
+        func.coalesce(func.sum(case((DebtBalance.user_from == user_id, DebtBalance.amount), else_=0)), 0).label("user_owes")
+    ).filter(
+        (DebtBalance.user_to == user_id) | (DebtBalance.user_from == user_id)
+    ).one()
+    
+    total_owed_to_user = float(debt_totals.owed_to_user)
+    total_user_owes = float(debt_totals.user_owes)
+    
+    # The user's groups, fetched once for the count and the group summaries
+    groups = db.query(Group).join(
+        GroupMember, GroupMember.group_id == Group.id
+    ).filter(GroupMember.user_id == user_id).all()
+    group_count = len(groups)
     
     # User summary
     user_summary = {
@@ -73,69 +89,74 @@ def get_user_dashboard(
         "total_owed_to_you": total_owed_to_user,  # Fixed field name
         "total_you_owe": total_user_owes,  # Fixed field name
         "net_balance": total_owed_to_user - total_user_owes,
-        "expense_count": len(user_expenses),
+        "expense_count": expense_count,
         "group_count": group_count
     }
     
-    # Recent expenses (last 10)
-    recent_expenses = db.query(Expense).filter(
-        (Expense.created_by == user_id) |
-        (Expense.paid_by == user_id) |
-        (Expense.id.in_(
-            db.query(ExpenseSplit.expense_id).filter(ExpenseSplit.user_id == user_id)
-        ))
+    # Recent expenses (last 10), with payer and group names joined in
+    recent_expenses = db.query(Expense, User.name, Group.name).outerjoin(
+        User, User.id == Expense.paid_by
+    ).outerjoin(
+        Group, Group.id == Expense.group_id
+    ).filter(
+        expense_service.user_expense_filter(user_id)
     ).order_by(Expense.date.desc(), Expense.created_at.desc()).limit(10).all()
     
     recent_expense_list = []
-    for exp in recent_expenses:
-        payer = db.query(User).filter(User.id == exp.paid_by).first()
-        group = db.query(Group).filter(Group.id == exp.group_id).first() if exp.group_id else None
-        
+    for exp, payer_name, group_name in recent_expenses:
         recent_expense_list.append({
             "id": exp.id,
             "amount": exp.amount,
             "description": exp.description,
             "category": exp.category,
             "date": exp.date,
-            "payer_name": payer.name if payer else "Unknown",
-            "group_name": group.name if group else None
+            "payer_name": payer_name or "Unknown",
+            "group_name": group_name
         })
     
-    # Group summaries
-    memberships = db.query(GroupMember).filter(GroupMember.user_id == user_id).all()
-    group_summaries = []
+    # Group summaries, with each group's totals aggregated in the database
+    group_ids = [group.id for group in groups]
+    member_counts = group_service.get_member_counts(db, group_ids)
     
-    for membership in memberships:
-        group = db.query(Group).filter(Group.id == membership.group_id).first()
-        if not group:
-            continue
-        
-        group_expenses = db.query(Expense).filter(Expense.group_id == group.id).all()
-        member_count = db.query(GroupMember).filter(GroupMember.group_id == group.id).count()
-        settlements = db.query(Settlement).filter(Settlement.group_id == group.id).all()
-        
-        total_settled = sum(float(s.amount) for s in settlements)
-        
-        # Outstanding debts for this group
-        group_debts = db.query(DebtBalance).filter(DebtBalance.group_id == group.id).all()
-        outstanding = sum(float(d.amount) for d in group_debts)
+    expense_totals = {
+        row.group_id: row for row in db.query(
+            Expense.group_id,
+            func.coalesce(func.sum(Expense.amount), 0).label("total"),
+            func.count(Expense.id).label("count")
+        ).filter(Expense.group_id.in_(group_ids)).group_by(Expense.group_id)
+    }
+    settlement_totals = {
+        row.group_id: row for row in db.query(
+            Settlement.group_id,
+            func.coalesce(func.sum(Settlement.amount), 0).label("total"),
+            func.count(Settlement.id).label("count")
+        ).filter(Settlement.group_id.in_(group_ids)).group_by(Settlement.group_id)
+    }
+    outstanding_totals = dict(
+        db.query(
+            DebtBalance.group_id,
+            func.coalesce(func.sum(DebtBalance.amount), 0)
+        ).filter(DebtBalance.group_id.in_(group_ids)).group_by(DebtBalance.group_id).all()
+    )
+    
+    group_summaries = []
+    for group in groups:
+        expenses_row = expense_totals.get(group.id)
+        settlements_row = settlement_totals.get(group.id)
         
         group_summaries.append({
             "group_id": group.id,
             "group_name": group.name,
-            "total_expenses": sum(float(e.amount) for e in group_expenses),
-            "member_count": member_count,
-            "expense_count": len(group_expenses),
-            "settlement_count": len(settlements),
-            "total_settled": total_settled,
-            "outstanding_debts": outstanding
+            "total_expenses": float(expenses_row.total) if expenses_row else 0.0,
+            "member_count": member_counts.get(group.id, 0),
+            "expense_count": expenses_row.count if expenses_row else 0,
+            "settlement_count": settlements_row.count if settlements_row else 0,
+            "total_settled": float(settlements_row.total) if settlements_row else 0.0,
+            "outstanding_debts": float(outstanding_totals.get(group.id, 0))
         })
     
-    # Category breakdown
-    category_breakdown = calculate_category_breakdown(user_expenses)
-    
-    # Monthly trends
-    monthly_trends = calculate_monthly_trends(user_expenses, months)
+    # Category breakdown and monthly trends
+    category_breakdown, monthly_trends = summarize_expense_buckets(expense_buckets)
     
     # Top 5 categories
     top_categories = sorted(category_breakdown, key=lambda x: x["total_amount"], reverse=True)[:5]
@@ -150,16 +171,52 @@ def get_user_dashboard(
     }
 
 
+def summarize_expense_buckets(buckets: list) -> Tuple[List[dict], List[dict]]:
+    """
+    Roll per-month, per-category expense sums up into dashboard breakdowns.
+    
+    Args:
+        buckets: Rows of (year, month, category, total, count) aggregated in SQL
+        
+    Returns:
+        Tuple of (category breakdown, monthly trends)
+    """
+    category_totals = defaultdict(lambda: {"amount": 0.0, "count": 0})
+    monthly_totals = defaultdict(lambda: defaultdict(lambda: {"amount": 0.0, "count": 0}))
+    
+    for row in buckets:
+        category = row.category or "Uncategorized"
+        month_key = f"{int(row.year):04d}-{int(row.month):02d}"
+        for data in (category_totals[category], monthly_totals[month_key][category]):
+            data["amount"] += float(row.total)
+            data["count"] += row.count
+    
+    category_breakdown = build_category_breakdown(
+        category_totals,
+        sum(data["amount"] for data in category_totals.values())
+    )
+    
+    return category_breakdown, build_monthly_trends(monthly_totals)
+
+
 def calculate_category_breakdown(expenses: List[Expense]) -> List[dict]:
     """Calculate expense breakdown by category."""
     category_totals = defaultdict(lambda: {"amount": 0.0, "count": 0})
-    total_amount = sum(float(exp.amount) for exp in expenses)
+    total_amount = 0.0
     
+    # One pass: convert each amount once and add it to its bucket and the total
     for exp in expenses:
-        category = exp.category or "Uncategorized"
-        category_totals[category]["amount"] += float(exp.amount)
-        category_totals[category]["count"] += 1
+        amount = float(exp.amount)
+        data = category_totals[exp.category or "Uncategorized"]
+        data["amount"] += amount
+        data["count"] += 1
+        total_amount += amount
     
+    return build_category_breakdown(category_totals, total_amount)
+
+
+def build_category_breakdown(category_totals: Dict[str, dict], total_amount: float) -> List[dict]:
+    """Turn per-category amounts and counts into breakdown entries, largest first."""
     breakdown = []
     for category, data in category_totals.items():
         percentage = (data["amount"] / total_amount * 100) if total_amount > 0 else 0
@@ -175,26 +232,32 @@ def calculate_category_breakdown(expenses: List[Expense]) -> List[dict]:
 
 def calculate_monthly_trends(expenses: List[Expense], months: int = 6) -> List[dict]:
     """Calculate monthly expense trends."""
-    # Group expenses by month
-    monthly_data = defaultdict(lambda: {"expenses": [], "total": 0.0, "count": 0})
+    # Bucket expenses by month and category in a single pass. Months are
+    # keyed by (year, month) and only formatted once each, not per expense
+    monthly_totals = defaultdict(lambda: defaultdict(lambda: {"amount": 0.0, "count": 0}))
     
     for exp in expenses:
-        month_key = exp.date.strftime("%Y-%m")
-        monthly_data[month_key]["expenses"].append(exp)
-        monthly_data[month_key]["total"] += float(exp.amount)
-        monthly_data[month_key]["count"] += 1
-    
-    # Build trends
+        expense_date = exp.date
+        data = monthly_totals[expense_date.year, expense_date.month][exp.category or "Uncategorized"]
+        data["amount"] += float(exp.amount)
+        data["count"] += 1
+    
+    return build_monthly_trends({
+        f"{year:04d}-{month:02d}": month_categories
+        for (year, month), month_categories in monthly_totals.items()
+    })
+
+
+def build_monthly_trends(monthly_totals: Dict[str, Dict[str, dict]]) -> List[dict]:
+    """Turn per-month, per-category amounts and counts into trend entries, oldest first."""
     trends = []
-    for month, data in sorted(monthly_data.items()):
-        # Category breakdown for this month
-        category_breakdown = calculate_category_breakdown(data["expenses"])
-        
+    for month, month_categories in sorted(monthly_totals.items()):
+        month_total = sum(data["amount"] for data in month_categories.values())
         trends.append({
             "month": month,
-            "total_amount": data["total"],  # Changed from total_expenses
-            "expense_count": data["count"],
-            "categories": category_breakdown
+            "total_amount": month_total,
+            "expense_count": sum(data["count"] for data in month_categories.values()),
+            "categories": build_category_breakdown(month_categories, month_total)
         })
     
     return trends
@@ -221,7 +284,7 @@ def get_group_analytics(
         Group analytics data
     """
     # Verify group exists
-    group = db.query(Group).filter(Group.id == group_id).first()
+    group = db.get(Group, group_id)
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -229,12 +292,7 @@ def get_group_analytics(
         )
     
     # Verify user is a member
-    membership = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.user_id == current_user_id
-    ).first()
-    
-    if not membership:
+    if not verify_group_membership(db, group_id, current_user_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this group"
@@ -287,12 +345,16 @@ def get_group_analytics(
         member_payments[exp.paid_by]["amount"] += float(exp.amount)
         member_payments[exp.paid_by]["count"] += 1
     
+    # Payer names in one query rather than one lookup per member
+    user_names = dict(
+        db.query(User.id, User.name).filter(User.id.in_(member_payments.keys()))
+    )
+    
     member_contributions = []
     for user_id, data in member_payments.items():
-        user = db.query(User).filter(User.id == user_id).first()
         member_contributions.append({
             "user_id": user_id,
-            "user_name": user.name if user else "Unknown",
+            "user_name": user_names.get(user_id, "Unknown"),
             "total_paid": data["amount"],
             "expense_count": data["count"],
             "percentage": round((data["amount"] / total_expenses * 100), 2)
@@ -302,11 +364,10 @@ def get_group_analytics(
     
     # Most active member (by expense count)
     most_active = max(member_payments.items(), key=lambda x: x[1]["count"])
-    most_active_user = db.query(User).filter(User.id == most_active[0]).first()
     
     most_active_member = {
         "user_id": most_active[0],
-        "user_name": most_active_user.name if most_active_user else "Unknown",
+        "user_name": user_names.get(most_active[0], "Unknown"),
         "expense_count": most_active[1]["count"]
     }
     
@@ -125,7 +125,7 @@ def update_user(db: Session, user_id: UUID, user_data: UserUpdate) -> User:
     Raises:
         HTTPException: 404 if user not found
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     
     if not user:
         raise HTTPException(
@@ -1,9 +1,12 @@
 """Chatbot service layer for expense parsing."""
+from sqlalchemy import select, func, distinct, or_
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List, Optional
+from starlette.concurrency import run_in_threadpool
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID, uuid4
 from datetime import date
 
+from app.core.cache import cached_value
 from app.services.openrouter_service import parse_expense_with_llm
 from app.models.user import User
 from app.models.group import Group, GroupMember
@@ -33,9 +36,11 @@ async def process_expense_input(
     Returns:
         ChatbotResponse with parsed data or clarification questions
     """
-    # Get user context
-    user_groups = get_user_groups(db, user_id)
-    recent_categories = get_recent_categories(db, user_id)
+    # Get user context. The queries are blocking, so run them in the
+    # threadpool to keep the event loop free while the database answers.
+    user_groups, recent_categories = await run_in_threadpool(
+        _get_user_context, db, user_id
+    )
     
     try:
         # Parse with LLM
@@ -100,6 +105,11 @@ async def process_expense_input(
         )
 
 
+def _get_user_context(db: Session, user_id: UUID) -> Tuple[List[str], List[str]]:
+    """Get the user's group names and recent categories for the LLM prompt."""
+    return get_user_groups(db, user_id), get_recent_categories(db, user_id)
+
+
 def generate_clarification_questions(
     parsed_expense: ParsedExpense,
     recent_categories: List[str]
@@ -152,8 +162,22 @@ def get_user_groups(db: Session, user_id: UUID) -> List[str]:
 
 
 def get_recent_categories(db: Session, user_id: UUID, limit: int = 10) -> List[str]:
-    """Get user's recent expense categories."""
-    expenses = db.query(Expense).filter(
+    """
+    Get user's recent expense categories.
+    
+    Cached per user; the entry is dropped whenever one of the user's
+    expenses changes (see app.core.cache).
+    """
+    return cached_value(
+        user_id,
+        f"recent_categories:{limit}",
+        lambda: _query_recent_categories(db, user_id, limit)
+    )
+
+
+def _query_recent_categories(db: Session, user_id: UUID, limit: int) -> List[str]:
+    """Query user's recent expense categories, most recent first."""
+    rows = db.query(Expense.category).filter(
         (Expense.created_by == user_id) |
         (Expense.paid_by == user_id)
     ).filter(
@@ -165,10 +189,10 @@ def get_recent_categories(db: Session, user_id: UUID, limit: int = 10) -> List[s
     # Deduplicate while preserving order
     seen = set()
     categories = []
-    for exp in expenses:
-        if exp.category and exp.category not in seen:
-            seen.add(exp.category)
-            categories.append(exp.category)
+    for (category,) in rows:
+        if category and category not in seen:
+            seen.add(category)
+            categories.append(category)
             if len(categories) >= limit:
                 break
     
@@ -223,22 +247,29 @@ def search_users_by_names(db: Session, names: List[str]) -> List[Dict[str, Any]]
     """
     Search for users by first names.
     Returns list of users with potential duplicates.
+    
+    All names are matched in a single query (backed by the trigram index on
+    users.name); matches are then attributed to each searched name.
     """
-    results = []
+    if not names:
+        return []
+    
+    # Case-insensitive search
+    users = db.query(User).filter(
+        or_(*(User.name.ilike(f"%{name}%") for name in names))
+    ).all()
     
+    results = []
     for name in names:
-        # Case-insensitive search
-        users = db.query(User).filter(
-            User.name.ilike(f"%{name}%")
-        ).all()
-        
+        needle = name.lower()
         for user in users:
-            results.append({
-                "search_name": name,
-                "user_id": str(user.id),
-                "name": user.name,
-                "email": user.email
-            })
+            if needle in user.name.lower():
+                results.append({
+                    "search_name": name,
+                    "user_id": str(user.id),
+                    "name": user.name,
+                    "email": user.email
+                })
     
     return results
 
@@ -250,36 +281,43 @@ def find_common_groups(
 ) -> List[Dict[str, Any]]:
     """
     Find groups that contain current user and all participants.
+    
+    The intersection is computed in SQL: memberships of the current user and
+    participants are grouped per group, and only groups where every one of
+    them is a member survive the HAVING clause.
     """
-    # Get all groups current user is in
-    user_groups = db.query(GroupMember).filter(
-        GroupMember.user_id == current_user_id
-    ).all()
+    user_ids = {current_user_id, *participant_ids}
     
-    user_group_ids = {m.group_id for m in user_groups}
+    common_group_ids = select(GroupMember.group_id).where(
+        GroupMember.user_id.in_(user_ids)
+    ).group_by(
+        GroupMember.group_id
+    ).having(
+        func.count(distinct(GroupMember.user_id)) == len(user_ids)
+    ).subquery()
     
-    # Find groups that contain all participants
-    common_groups = []
+    # Member count of each matching group
+    member_counts = select(
+        GroupMember.group_id,
+        func.count(GroupMember.id).label("member_count")
+    ).where(
+        GroupMember.group_id.in_(select(common_group_ids.c.group_id))
+    ).group_by(GroupMember.group_id).subquery()
     
-    for group_id in user_group_ids:
-        # Check if all participants are in this group
-        members = db.query(GroupMember).filter(
-            GroupMember.group_id == group_id
-        ).all()
-        
-        member_ids = {m.user_id for m in members}
-        
-        # Check if all participants are members
-        if all(pid in member_ids for pid in participant_ids):
-            group = db.query(Group).filter(Group.id == group_id).first()
-            if group:
-                common_groups.append({
-                    "group_id": str(group.id),
-                    "group_name": group.name,
-                    "member_count": len(members)
-                })
+    rows = db.query(
+        Group.id, Group.name, member_counts.c.member_count
+    ).join(
+        member_counts, member_counts.c.group_id == Group.id
+    ).all()
     
-    return common_groups
+    return [
+        {
+            "group_id": str(row.id),
+            "group_name": row.name,
+            "member_count": row.member_count
+        }
+        for row in rows
+    ]
 
 
 def create_participant_conversation(
@@ -223,7 +223,7 @@ async def handle_debt_query(
     # Filter by group if specified
     if group_name:
         # Find group by name
-        groups, _ = get_user_groups(db, user_id)
+        groups, _, _ = get_user_groups(db, user_id)
         matching_group = next((g for g in groups if group_name.lower() in g.name.lower()), None)
         
         if matching_group:
@@ -297,7 +297,7 @@ async def handle_group_query(
     Returns:
         Query result data
     """
-    groups, total = get_user_groups(db, user_id)
+    groups, total, _ = get_user_groups(db, user_id)
     
     return {
         "type": "user_groups",
@@ -1,17 +1,56 @@
 """Expense service layer - handles expense operations and debt calculations."""
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, insert, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
 from fastapi import HTTPException, status
 from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import date
 from decimal import Decimal
 
+from app.core.cache import invalidate_on_commit
 from app.models.user import User
 from app.models.group import Group, GroupMember
 from app.models.expense import Expense, ExpenseSplit
 from app.models.debt_balance import DebtBalance
 from app.schemas.expense import ExpenseCreate, ExpenseUpdate, SplitType
 from app.services import activity_service
+from app.utils.pagination import paginate
+
+
+def has_split_for(user_id: UUID):
+    """
+    Correlated EXISTS for an expense having a split for the user.
+    
+    Lets the planner probe the (user_id, expense_id) split index per expense
+    instead of materializing the user's split ids for an IN list.
+    
+    Args:
+        user_id: User ID
+        
+    Returns:
+        SQL expression to filter expense queries with
+    """
+    return exists().where(
+        ExpenseSplit.expense_id == Expense.id,
+        ExpenseSplit.user_id == user_id
+    )
+
+
+def user_expense_filter(user_id: UUID):
+    """
+    Filter for expenses a user is involved in (creator, payer, or in splits).
+    
+    Args:
+        user_id: User ID
+        
+    Returns:
+        SQL expression to filter expense queries with
+    """
+    return or_(
+        Expense.created_by == user_id,
+        Expense.paid_by == user_id,
+        has_split_for(user_id)
+    )
 
 
 def calculate_splits(
@@ -19,7 +58,7 @@ def calculate_splits(
     split_type: SplitType,
     splits_input: list,
     num_people: int
-) -> List[Tuple[UUID, float, Optional[float]]]:
+) -> List[Tuple[UUID, float]]:
     """
     Calculate split amounts based on split type.
     
@@ -30,7 +69,7 @@ def calculate_splits(
         num_people: Number of people splitting
         
     Returns:
-        List of tuples (user_id, share_amount, share_percentage)
+        List of tuples (user_id, share_amount)
     """
     result = []
     
@@ -38,18 +77,18 @@ def calculate_splits(
         # Divide equally
         share_amount = round(amount / num_people, 2)
         for split in splits_input:
-            result.append((split.user_id, share_amount, None))
+            result.append((split.user_id, share_amount))
             
     elif split_type == SplitType.EXACT:
         # Use exact amounts provided
         for split in splits_input:
-            result.append((split.user_id, split.share_amount, None))
+            result.append((split.user_id, split.share_amount))
             
     elif split_type == SplitType.PERCENTAGE:
         # Calculate from percentages
         for split in splits_input:
             share_amount = round((amount * split.share_percentage) / 100, 2)
-            result.append((split.user_id, share_amount, split.share_percentage))
+            result.append((split.user_id, share_amount))
     
     return result
 
@@ -146,7 +185,7 @@ def create_expense(
         HTTPException: If validation fails
     """
     # Verify payer exists
-    payer = db.query(User).filter(User.id == expense_data.paid_by).first()
+    payer = db.get(User, expense_data.paid_by)
     if not payer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -155,20 +194,23 @@ def create_expense(
     
     # If group expense, verify group and memberships
     if expense_data.group_id:
-        group = db.query(Group).filter(Group.id == expense_data.group_id).first()
+        group = db.get(Group, expense_data.group_id)
         if not group:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Group not found"
             )
         
-        # Verify creator is a member
-        creator_membership = db.query(GroupMember).filter(
-            GroupMember.group_id == expense_data.group_id,
-            GroupMember.user_id == creator_id
-        ).first()
+        # Look up the creator's and all split users' memberships at once
+        member_ids = {
+            row.user_id for row in db.query(GroupMember.user_id).filter(
+                GroupMember.group_id == expense_data.group_id,
+                GroupMember.user_id.in_([creator_id] + [split.user_id for split in expense_data.splits])
+            )
+        }
         
-        if not creator_membership:
+        # Verify creator is a member
+        if creator_id not in member_ids:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You are not a member of this group"
@@ -176,13 +218,8 @@ def create_expense(
         
         # Verify all split users are members
         for split in expense_data.splits:
-            membership = db.query(GroupMember).filter(
-                GroupMember.group_id == expense_data.group_id,
-                GroupMember.user_id == split.user_id
-            ).first()
-            
-            if not membership:
-                user = db.query(User).filter(User.id == split.user_id).first()
+            if split.user_id not in member_ids:
+                user = db.get(User, split.user_id)
                 user_name = user.name if user else str(split.user_id)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -198,7 +235,8 @@ def create_expense(
         is_personal=expense_data.is_personal,
         group_id=expense_data.group_id,
         created_by=creator_id,
-        paid_by=expense_data.paid_by
+        paid_by=expense_data.paid_by,
+        split_count=len(expense_data.splits)  # One split per input, set before the INSERT
     )
     db.add(db_expense)
     db.flush()  # Get the expense ID
@@ -211,19 +249,16 @@ def create_expense(
         len(expense_data.splits)
     )
     
-    for user_id, share_amount, share_percentage in splits:
-        split = ExpenseSplit(
-            expense_id=db_expense.id,
-            user_id=user_id,
-            share_amount=share_amount,
-            share_percentage=share_percentage
-        )
-        db.add(split)
+    # One multi-row INSERT instead of a flush of N ORM objects
+    db.execute(insert(ExpenseSplit), [
+        {"expense_id": db_expense.id, "user_id": user_id, "share_amount": share_amount}
+        for user_id, share_amount in splits
+    ])
+    invalidate_on_commit(db, [user_id for user_id, _ in splits])
     
     # Update debt balances if group expense
     if expense_data.group_id:
-        split_tuples = [(user_id, share_amount) for user_id, share_amount, _ in splits]
-        update_debt_balances(db, expense_data.group_id, expense_data.paid_by, split_tuples)
+        update_debt_balances(db, expense_data.group_id, expense_data.paid_by, splits)
     
     db.commit()
     db.refresh(db_expense)
@@ -258,8 +293,10 @@ def get_expenses(
     min_amount: Optional[float] = None,
     max_amount: Optional[float] = None,
     page: int = 1,
-    limit: int = 20
-) -> Tuple[List[Expense], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    include_count: bool = False
+) -> Tuple[List[Expense], Optional[int], Optional[str]]:
     """
     Get expenses with filtering and pagination.
     
@@ -267,23 +304,19 @@ def get_expenses(
         db: Database session
         user_id: Current user ID
         ... (filter parameters)
-        page: Page number
+        page: Page number (ignored when a cursor is given)
         limit: Items per page
+        cursor: Optional keyset cursor from a previous page's next_cursor
+        include_count: Also count the total on cursor pages
         
     Returns:
-        Tuple of (expenses list, total count)
+        Tuple of (expenses list, total count or None, next cursor)
     """
     # Base query - user must be involved (creator, payer, or in splits)
-    query = db.query(Expense).distinct()
+    query = db.query(Expense)
     
     # User must be involved in the expense
-    query = query.filter(
-        (Expense.created_by == user_id) |
-        (Expense.paid_by == user_id) |
-        (Expense.id.in_(
-            db.query(ExpenseSplit.expense_id).filter(ExpenseSplit.user_id == user_id)
-        ))
-    )
+    query = query.filter(user_expense_filter(user_id))
     
     # Apply filters
     if group_id:
@@ -303,10 +336,7 @@ def get_expenses(
     
     if involves_user:
         query = query.filter(
-            (Expense.paid_by == involves_user) |
-            (Expense.id.in_(
-                db.query(ExpenseSplit.expense_id).filter(ExpenseSplit.user_id == involves_user)
-            ))
+            (Expense.paid_by == involves_user) | has_split_for(involves_user)
         )
     
     if is_personal is not None:
@@ -318,14 +348,44 @@ def get_expenses(
     if max_amount is not None:
         query = query.filter(Expense.amount <= max_amount)
     
-    # Get total count
-    total_count = query.count()
+    # Payer and group are joined in so building the list needs no per-row
+    # lookups
+    query = query.options(
+        joinedload(Expense.payer),
+        joinedload(Expense.group)
+    )
     
-    # Apply pagination and ordering
-    offset = (page - 1) * limit
-    expenses = query.order_by(Expense.date.desc(), Expense.created_at.desc()).offset(offset).limit(limit).all()
+    # Most recent first
+    return paginate(
+        query,
+        (Expense.date, Expense.created_at, Expense.id),
+        page,
+        limit,
+        cursor,
+        include_count
+    )
+
+
+def load_expense_with_details(db: Session, expense_id: UUID) -> Optional[Expense]:
+    """
+    Load an expense with creator, payer, group and split users.
+    
+    Creator, payer and group are joined into the expense row; splits and
+    their users come from one extra query.
     
-    return expenses, total_count
+    Args:
+        db: Database session
+        expense_id: Expense ID
+        
+    Returns:
+        Expense object or None if not found
+    """
+    return db.query(Expense).options(
+        joinedload(Expense.creator),
+        joinedload(Expense.payer),
+        joinedload(Expense.group),
+        selectinload(Expense.splits).joinedload(ExpenseSplit.user)
+    ).populate_existing().filter(Expense.id == expense_id).first()
 
 
 def get_expense_details(
@@ -347,7 +407,7 @@ def get_expense_details(
     Raises:
         HTTPException: 404 if not found, 403 if not authorized
     """
-    expense = db.query(Expense).filter(Expense.id == expense_id).first()
+    expense = load_expense_with_details(db, expense_id)
     
     if not expense:
         raise HTTPException(
@@ -355,14 +415,11 @@ def get_expense_details(
             detail="Expense not found"
         )
     
-    # Verify user is involved
+    # Verify user is involved (splits are already loaded)
     is_involved = (
         expense.created_by == current_user_id or
         expense.paid_by == current_user_id or
-        db.query(ExpenseSplit).filter(
-            ExpenseSplit.expense_id == expense_id,
-            ExpenseSplit.user_id == current_user_id
-        ).first() is not None
+        any(split.user_id == current_user_id for split in expense.splits)
     )
     
     if not is_involved:
@@ -1,7 +1,8 @@
 """Group service layer - handles all group-related business logic."""
-from sqlalchemy.orm import Session
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime, timedelta
 
@@ -10,13 +11,14 @@ from app.models.group import Group, GroupMember, GroupMemberRole
 from app.models.invitation import Invitation, InvitationStatus
 from app.schemas.group import GroupCreate, GroupUpdate
 from app.services import activity_service
+from app.utils.pagination import paginate
 
 
 def create_group(
     db: Session,
     group_data: GroupCreate,
     creator_id: UUID
-) -> Group:
+) -> Tuple[Group, int]:
     """
     Create a new group with the creator as owner.
     
@@ -26,7 +28,7 @@ def create_group(
         creator_id: ID of the user creating the group
         
     Returns:
-        Created group object
+        Tuple of (created group, number of members)
     """
     # Create the group
     db_group = Group(
@@ -44,13 +46,18 @@ def create_group(
         role=GroupMemberRole.OWNER
     )
     db.add(creator_membership)
+    member_count = 1
+    
+    # Add other members (if any); existence is checked for all IDs at once
+    existing_ids = set()
+    if group_data.member_ids:
+        existing_ids = {
+            row.id for row in db.query(User.id).filter(User.id.in_(group_data.member_ids))
+        }
     
-    # Add other members (if any)
     for member_id in group_data.member_ids:
-        # Verify user exists
-        user = db.query(User).filter(User.id == member_id).first()
-        if not user:
-            # Skip invalid user IDs instead of raising error
+        # Skip invalid user IDs instead of raising error
+        if member_id not in existing_ids:
             continue
         
         # Don't add creator again
@@ -65,6 +72,7 @@ def create_group(
             invited_by=creator_id
         )
         db.add(member_membership)
+        member_count += 1
     
     db.commit()
     db.refresh(db_group)
@@ -80,39 +88,79 @@ def create_group(
     except Exception as e:
         print(f"Failed to log group creation activity: {e}")
     
-    return db_group
+    return db_group, member_count
 
 
 def get_user_groups(
     db: Session,
     user_id: UUID,
     page: int = 1,
-    limit: int = 20
-) -> tuple[List[Group], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    include_count: bool = False
+) -> tuple[List[Group], Optional[int], Optional[str]]:
     """
     Get all groups that a user is a member of.
     
     Args:
         db: Database session
         user_id: User ID
-        page: Page number (1-indexed)
+        page: Page number (1-indexed, ignored when a cursor is given)
         limit: Items per page
+        cursor: Optional keyset cursor from a previous page's next_cursor
+        include_count: Also count the total on cursor pages
         
     Returns:
-        Tuple of (list of groups, total count)
+        Tuple of (list of groups, total count or None, next cursor)
     """
     # Query groups where user is a member
     query = db.query(Group).join(GroupMember).filter(
         GroupMember.user_id == user_id
     )
     
-    total_count = query.count()
+    # Newest first
+    return paginate(query, (Group.created_at, Group.id), page, limit, cursor, include_count)
+
+
+def get_member_counts(db: Session, group_ids: List[UUID]) -> Dict[UUID, int]:
+    """
+    Count members of several groups in one grouped query.
     
-    # Apply pagination
-    offset = (page - 1) * limit
-    groups = query.order_by(Group.created_at.desc()).offset(offset).limit(limit).all()
+    Args:
+        db: Database session
+        group_ids: Group IDs
+        
+    Returns:
+        Dictionary mapping group ID to its number of members
+    """
+    if not group_ids:
+        return {}
+    
+    rows = db.query(
+        GroupMember.group_id, func.count(GroupMember.user_id)
+    ).filter(
+        GroupMember.group_id.in_(group_ids)
+    ).group_by(GroupMember.group_id).all()
     
-    return groups, total_count
+    return dict(rows)
+
+
+def get_group_with_member_count(db: Session, group_id: UUID) -> Tuple[Group, int]:
+    """
+    Load a group together with its member count in one query.
+    
+    Args:
+        db: Database session
+        group_id: Group ID
+        
+    Returns:
+        Tuple of (group, number of members)
+    """
+    return db.query(
+        Group, func.count(GroupMember.user_id)
+    ).outerjoin(
+        GroupMember, GroupMember.group_id == Group.id
+    ).filter(Group.id == group_id).group_by(Group.id).one()
 
 
 def get_group_details(
@@ -129,13 +177,16 @@ def get_group_details(
         current_user_id: Current user ID
         
     Returns:
-        Group object with members
+        Group object with creator and members (with their users) loaded
         
     Raises:
         HTTPException: 404 if group not found, 403 if user not a member
     """
-    # Fetch group
-    group = db.query(Group).filter(Group.id == group_id).first()
+    # Fetch group with creator, then members and their users in one IN query
+    group = db.query(Group).options(
+        joinedload(Group.creator),
+        selectinload(Group.members).joinedload(GroupMember.user)
+    ).filter(Group.id == group_id).first()
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -143,12 +194,7 @@ def get_group_details(
         )
     
     # Verify user is a member
-    membership = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.user_id == current_user_id
-    ).first()
-    
-    if not membership:
+    if not any(member.user_id == current_user_id for member in group.members):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this group"
@@ -162,7 +208,7 @@ def update_group(
     group_id: UUID,
     current_user_id: UUID,
     update_data: GroupUpdate
-) -> Group:
+) -> Tuple[Group, int]:
     """
     Update group information.
     
@@ -173,13 +219,13 @@ def update_group(
         update_data: Update data
         
     Returns:
-        Updated group object
+        Tuple of (updated group, number of members)
         
     Raises:
         HTTPException: 404 if not found, 403 if not owner
     """
     # Fetch group
-    group = db.query(Group).filter(Group.id == group_id).first()
+    group = db.get(Group, group_id)
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -219,7 +265,8 @@ def update_group(
     except Exception as e:
         print(f"Failed to log group update activity: {e}")
     
-    return group
+    # Logging committed again, so reload the group with its member count
+    return get_group_with_member_count(db, group_id)
 
 
 def delete_group(
@@ -239,7 +286,7 @@ def delete_group(
         HTTPException: 404 if not found, 403 if not owner
     """
     # Fetch group
-    group = db.query(Group).filter(Group.id == group_id).first()
+    group = db.get(Group, group_id)
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -297,13 +344,13 @@ def add_member(
         invitee_id: ID of user to invite
         
     Returns:
-        Created invitation object
+        Created invitation object with group and inviter loaded
         
     Raises:
         HTTPException: 404 if group/user not found, 403 if not authorized
     """
     # Verify group exists
-    group = db.query(Group).filter(Group.id == group_id).first()
+    group = db.get(Group, group_id)
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -324,7 +371,7 @@ def add_member(
     
     # Determine invitee
     if invitee_id:
-        user = db.query(User).filter(User.id == invitee_id).first()
+        user = db.get(User, invitee_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -381,24 +428,29 @@ def add_member(
         )
         db.add(membership)
     
+    # The invitee was loaded above; keep the name before commit expires it
+    member_name = user.name if invitee_id else None
+    
     db.commit()
-    db.refresh(invitation)
     
     # Log activity for member added (only if immediately added)
     if invitee_id:
         try:
-            user = db.query(User).filter(User.id == invitee_id).first()
             activity_service.log_member_added(
                 db=db,
                 user_id=inviter_id,
                 group_id=group_id,
                 member_id=invitee_id,
-                member_name=user.name if user else "Unknown"
+                member_name=member_name
             )
         except Exception as e:
             print(f"Failed to log member added activity: {e}")
     
-    return invitation
+    # Reload with group and inviter so callers can build the response
+    return db.query(Invitation).options(
+        joinedload(Invitation.group),
+        joinedload(Invitation.inviter)
+    ).filter(Invitation.id == invitation.id).populate_existing().first()
 
 
 def remove_member(
@@ -515,12 +567,14 @@ def leave_group(
     
     # If user is owner, check if there are other members
     if membership.role == GroupMemberRole.OWNER:
-        other_members = db.query(GroupMember).filter(
-            GroupMember.group_id == group_id,
-            GroupMember.user_id != user_id
-        ).count()
+        has_other_members = db.query(
+            db.query(GroupMember).filter(
+                GroupMember.group_id == group_id,
+                GroupMember.user_id != user_id
+            ).exists()
+        ).scalar()
         
-        if other_members > 0:
+        if has_other_members:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Owner cannot leave group with other members. Transfer ownership or remove all members first."
@@ -536,7 +590,7 @@ def accept_invitation(
     db: Session,
     token: str,
     current_user_id: UUID
-) -> Group:
+) -> Tuple[Group, int]:
     """
     Accept a group invitation.
     
@@ -546,7 +600,7 @@ def accept_invitation(
         current_user_id: Current user ID
         
     Returns:
-        Group object
+        Tuple of (group, number of members)
         
     Raises:
         HTTPException: 404 if not found, 400 if expired/invalid
@@ -568,7 +622,7 @@ def accept_invitation(
         )
     
     # Verify not expired
-    if datetime.utcnow() > invitation.expires_at:
+    if invitation.is_expired:
         invitation.status = InvitationStatus.EXPIRED
         db.commit()
         raise HTTPException(
@@ -577,7 +631,7 @@ def accept_invitation(
         )
     
     # Verify current user matches invitee
-    current_user = db.query(User).filter(User.id == current_user_id).first()
+    current_user = db.get(User, current_user_id)
     if invitation.invitee_id and invitation.invitee_id != current_user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -613,12 +667,35 @@ def accept_invitation(
     # Update invitation status
     invitation.status = InvitationStatus.ACCEPTED
     invitation.invitee_id = current_user_id
+    group_id = invitation.group_id
     
     db.commit()
     
-    # Return group
-    group = db.query(Group).filter(Group.id == invitation.group_id).first()
-    return group
+    # Return group with its member count
+    return get_group_with_member_count(db, group_id)
+
+
+def expire_stale_invitations(db: Session) -> int:
+    """
+    Mark every pending invitation past its expiry date as expired.
+    
+    Runs as one UPDATE, served by the (status, expires_at) index.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Number of invitations expired
+    """
+    result = db.execute(
+        update(Invitation).where(
+            Invitation.status == InvitationStatus.PENDING,
+            Invitation.is_expired
+        ).values(status=InvitationStatus.EXPIRED).execution_options(synchronize_session=False)
+    )
+    db.commit()
+    
+    return result.rowcount
 
 
 def transfer_ownership(
@@ -681,5 +758,5 @@ def transfer_ownership(
     db.commit()
     
     # Return group
-    group = db.query(Group).filter(Group.id == group_id).first()
+    group = db.get(Group, group_id)
     return group
@@ -7,6 +7,30 @@ from datetime import date
 from app.core.config import settings
 
 
+# Shared HTTP client so LLM calls reuse pooled keep-alive connections
+# instead of paying a TCP + TLS handshake on every request
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class OpenRouterClient:
     """Client for OpenRouter API."""
     
@@ -41,21 +65,20 @@ class OpenRouterClient:
         Returns:
             API response dict
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/chat/completions",
-                headers=self.headers,
-                json={
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens
-                },
-                timeout=30.0
-            )
-            
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client().post(
+            f"{self.BASE_URL}/chat/completions",
+            headers=self.headers,
+            json={
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            },
+            timeout=30.0
+        )
+        
+        response.raise_for_status()
+        return response.json()
 
 
 def build_expense_parser_prompt(
@@ -13,6 +13,7 @@ from app.schemas.chatbot import (
     CommonGroup,
     GroupResolutionResponse
 )
+from app.services import group_service
 
 
 def resolve_participant_names(
@@ -145,18 +146,16 @@ def find_common_groups(
         .all()
     )
     
+    # Count total members of all matching groups at once
+    member_counts = group_service.get_member_counts(db, [group.id for group in common_groups])
+    
     # Convert to response format
     group_list = []
     for group in common_groups:
-        # Count total members
-        member_count = db.query(GroupMember).filter(
-            GroupMember.group_id == group.id
-        ).count()
-        
         group_list.append(CommonGroup(
             group_id=group.id,
             group_name=group.name,
-            member_count=member_count
+            member_count=member_counts.get(group.id, 0)
         ))
     
     return GroupResolutionResponse(
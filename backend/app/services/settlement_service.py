@@ -1,17 +1,20 @@
 """Settlement and debt calculation service layer."""
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import Session, raiseload, selectinload
 from fastapi import HTTPException, status
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from uuid import UUID
-from collections import defaultdict
+import heapq
 
 from app.models.user import User
 from app.models.group import Group, GroupMember
 from app.models.settlement import Settlement
 from app.models.debt_balance import DebtBalance
 from app.models.expense import Expense, ExpenseSplit
-from app.schemas.settlement import SettlementCreate, SimplifiedDebt
+from app.schemas.settlement import SettlementCreate, SettlementResponse, SimplifiedDebt
 from app.services import activity_service
+from app.utils.pagination import paginate
+from app.utils.dependencies import verify_group_membership
 
 
 def calculate_net_balances(group_id: UUID, db: Session) -> Dict[UUID, float]:
@@ -29,32 +32,40 @@ def calculate_net_balances(group_id: UUID, db: Session) -> Dict[UUID, float]:
     Returns:
         Dictionary mapping user_id to net balance
     """
-    balances = defaultdict(float)
-    
-    # Get all debt balances for the group
-    debts = db.query(DebtBalance).filter(DebtBalance.group_id == group_id).all()
-    
-    for debt in debts:
-        # user_to should receive money (positive balance)
-        balances[debt.user_to] += float(debt.amount)
-        # user_from should pay money (negative balance)
-        balances[debt.user_from] -= float(debt.amount)
-    
-    return dict(balances)
+    # user_to should receive money (positive), user_from should pay (negative);
+    # summed per user in the database so one row comes back per member
+    flows = union_all(
+        select(DebtBalance.user_to.label("user_id"), DebtBalance.amount.label("amount"))
+        .where(DebtBalance.group_id == group_id),
+        select(DebtBalance.user_from, -DebtBalance.amount)
+        .where(DebtBalance.group_id == group_id)
+    ).subquery()
+    
+    rows = db.query(flows.c.user_id, func.sum(flows.c.amount)).group_by(flows.c.user_id).all()
+    
+    return {user_id: float(net) for user_id, net in rows}
+
+
+# Largest group for which the minimum number of transactions is computed
+# exactly. The search is O(2^n * n) and runs uncached on every request, so
+# it is kept to about a millisecond
+SUBSET_SEARCH_LIMIT = 10
 
 
 def simplify_debts_greedy(net_balances: Dict[UUID, float]) -> List[Tuple[UUID, UUID, float]]:
     """
-    Simplify debts using an OPTIMAL algorithm with subset matching.
+    Simplify debts into as few transactions as possible.
     
-    This algorithm minimizes the number of transactions by:
-    1. First finding groups of people whose debts cancel out exactly (circular debts)
-    2. Then using greedy matching for remaining debts
+    1. Balances are converted to integer cents so matching is exact.
+    2. For groups of up to SUBSET_SEARCH_LIMIT people, balances are split
+       into the largest possible number of disjoint subsets that each sum
+       to zero. A subset of k people settles in k - 1 transactions, so this
+       gives the minimum number of transactions overall.
+    3. Every part is settled with a heap-based greedy that matches the
+       largest creditor with the largest debtor, in O(n log n).
     
-    Example where this beats simple greedy:
-    A owes B: $10, B owes C: $10, C owes A: $10
-    - Simple greedy: 2-3 transactions
-    - Optimal: 0 transactions (they cancel out!)
+    Example: A +10, B -10, C +5, D -5 settles as B->A and D->C (2
+    transactions) rather than a chain of 3.
     
     Args:
         net_balances: Dictionary of user_id to net balance
@@ -62,111 +73,103 @@ def simplify_debts_greedy(net_balances: Dict[UUID, float]) -> List[Tuple[UUID, U
     Returns:
         List of tuples (from_user, to_user, amount)
     """
-    # Filter out near-zero balances (floating point handling)
-    threshold = 0.01
-    balances = {k: v for k, v in net_balances.items() if abs(v) > threshold}
+    # Work in cents, ignoring sub-cent noise
+    balances = [
+        (user_id, round(balance * 100))
+        for user_id, balance in net_balances.items()
+    ]
+    balances = [(user_id, cents) for user_id, cents in balances if abs(cents) > 1]
     
     if not balances:
         return []
     
-    # Convert to list of (user_id, balance)
-    balance_list = list(balances.items())
-    n = len(balance_list)
-    
-    # Try to find subsets that sum to zero and eliminate them
-    # This handles circular debt cancellation
-    balances = _eliminate_zero_sum_subsets(balance_list)
-    
-    if not balances:
-        return []
+    simplified = []
+    for part in _partition_zero_sum_subsets(balances):
+        simplified.extend(_heap_settlement(part))
     
-    # Now apply optimized greedy to remaining balances
-    return _greedy_settlement(dict(balances))
+    return simplified
 
 
-def _eliminate_zero_sum_subsets(balance_list: List[Tuple[UUID, float]]) -> List[Tuple[UUID, float]]:
+def _partition_zero_sum_subsets(
+    balance_list: List[Tuple[UUID, int]]
+) -> List[List[Tuple[UUID, int]]]:
     """
-    Find and eliminate subsets of balances that sum to zero.
-    This handles circular debts efficiently.
-    
-    Uses dynamic programming for small groups, greedy for larger ones.
+    Split balances into the maximum number of disjoint zero-sum subsets.
     
-    NOTE: We only eliminate PROPER subsets (not the entire set).
-    If the entire set sums to zero, we still need transactions to settle.
+    Dynamic programming over subsets: best[mask] is the largest number of
+    zero-sum parts the people in mask can be split into, found by removing
+    one person at a time and counting every prefix that sums to zero.
+    Groups larger than SUBSET_SEARCH_LIMIT are returned as a single part.
     """
-    if len(balance_list) <= 1:
-        return balance_list
-    
-    # For groups up to 10, we can try subset matching
-    # For larger groups, just return as-is (greedy will handle)
-    if len(balance_list) > 10:
-        return balance_list
-    
-    # Try to find subsets that sum to zero
     n = len(balance_list)
-    eliminated = [False] * n
-    
-    # Check all PROPER subsets of size 2 to n-1 (not the full set!)
-    # If we eliminate the full set, we'd return empty and generate no transactions
-    for subset_size in range(2, n):  # Changed from n+1 to n
-        from itertools import combinations
-        for indices in combinations(range(n), subset_size):
-            if any(eliminated[i] for i in indices):
-                continue
-            
-            subset_sum = sum(balance_list[i][1] for i in indices)
-            if abs(subset_sum) < 0.01:  # Sums to zero
-                # Mark all in subset as eliminated
-                for i in indices:
-                    eliminated[i] = True
-    
-    # Return non-eliminated balances
-    return [balance_list[i] for i in range(n) if not eliminated[i]]
+    if n <= 2 or n > SUBSET_SEARCH_LIMIT:
+        return [balance_list]
+    
+    full = (1 << n) - 1
+    sums = [0] * (full + 1)
+    best = [0] * (full + 1)
+    for mask in range(1, full + 1):
+        low_bit = mask & -mask
+        sums[mask] = sums[mask ^ low_bit] + balance_list[low_bit.bit_length() - 1][1]
+        
+        most = 0
+        rest = mask
+        while rest:
+            bit = rest & -rest
+            rest ^= bit
+            if best[mask ^ bit] > most:
+                most = best[mask ^ bit]
+        best[mask] = most + (sums[mask] == 0)
+    
+    # Walk back from the full set; each zero-sum prefix closes a part
+    parts = []
+    part = []
+    mask = full
+    while mask:
+        target = best[mask] - (sums[mask] == 0)
+        rest = mask
+        while rest:
+            bit = rest & -rest
+            rest ^= bit
+            if best[mask ^ bit] == target:
+                break
+        part.append(balance_list[bit.bit_length() - 1])
+        mask ^= bit
+        if sums[mask] == 0:
+            parts.append(part)
+            part = []
+    
+    return parts
 
 
-def _greedy_settlement(net_balances: Dict[UUID, float]) -> List[Tuple[UUID, UUID, float]]:
+def _heap_settlement(balances: List[Tuple[UUID, int]]) -> List[Tuple[UUID, UUID, float]]:
     """
-    Apply greedy settlement algorithm to remaining balances.
-    Matches largest creditor with largest debtor.
-    """
-    threshold = 0.01
-    
-    # Separate creditors and debtors
-    creditors = []  # People who should receive money
-    debtors = []    # People who should pay money
-    
-    for user_id, balance in net_balances.items():
-        if balance > threshold:
-            creditors.append([user_id, balance])
-        elif balance < -threshold:
-            debtors.append([user_id, -balance])  # Store as positive amount
+    Settle balances (in cents) by repeatedly matching the largest creditor
+    with the largest debtor.
     
-    # Sort by amount (largest first) for optimal matching
-    creditors.sort(key=lambda x: x[1], reverse=True)
-    debtors.sort(key=lambda x: x[1], reverse=True)
+    Each round fully settles at least one person, so there are at most
+    n - 1 rounds of O(log n) heap operations.
+    """
+    # Max-heaps via negated amounts
+    creditors = [(-cents, user_id) for user_id, cents in balances if cents > 0]
+    debtors = [(cents, user_id) for user_id, cents in balances if cents < 0]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
     
     simplified = []
-    
-    i, j = 0, 0
-    while i < len(creditors) and j < len(debtors):
-        creditor_id, credit_amount = creditors[i]
-        debtor_id, debt_amount = debtors[j]
+    while creditors and debtors:
+        credit, creditor_id = heapq.heappop(creditors)
+        debt, debtor_id = heapq.heappop(debtors)
         
         # Settle the minimum of what's owed and what's needed
-        settle_amount = min(credit_amount, debt_amount)
+        settle_cents = min(-credit, -debt)
+        simplified.append((debtor_id, creditor_id, settle_cents / 100))
         
-        if settle_amount > threshold:
-            simplified.append((debtor_id, creditor_id, round(settle_amount, 2)))
-        
-        # Update remaining amounts
-        creditors[i][1] -= settle_amount
-        debtors[j][1] -= settle_amount
-        
-        # Move to next creditor/debtor if current one is settled
-        if creditors[i][1] < threshold:
-            i += 1
-        if debtors[j][1] < threshold:
-            j += 1
+        # Push back whoever still has a balance
+        if -credit > settle_cents:
+            heapq.heappush(creditors, (credit + settle_cents, creditor_id))
+        if -debt > settle_cents:
+            heapq.heappush(debtors, (debt + settle_cents, debtor_id))
     
     return simplified
 
@@ -191,7 +194,7 @@ def get_group_debt_summary(
         HTTPException: 404 if group not found, 403 if not a member
     """
     # Verify group exists
-    group = db.query(Group).filter(Group.id == group_id).first()
+    group = db.get(Group, group_id)
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -199,12 +202,7 @@ def get_group_debt_summary(
         )
     
     # Verify user is a member
-    membership = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.user_id == current_user_id
-    ).first()
-    
-    if not membership:
+    if not verify_group_membership(db, group_id, current_user_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this group"
@@ -243,7 +241,7 @@ def get_group_debt_summary(
         who_owes_you = []
         for debt in debts:
             if debt.user_to == user.id:
-                debtor = db.query(User).filter(User.id == debt.user_from).first()
+                debtor = db.get(User, debt.user_from)
                 who_owes_you.append({
                     "user_id": debt.user_from,
                     "user_name": debtor.name if debtor else "Unknown",
@@ -254,7 +252,7 @@ def get_group_debt_summary(
         who_you_owe = []
         for debt in debts:
             if debt.user_from == user.id:
-                creditor = db.query(User).filter(User.id == debt.user_to).first()
+                creditor = db.get(User, debt.user_to)
                 who_you_owe.append({
                     "user_id": debt.user_to,
                     "user_name": creditor.name if creditor else "Unknown",
@@ -278,8 +276,8 @@ def get_group_debt_summary(
     # Build simplified debts with user names
     simplified_debts = []
     for from_id, to_id, amount in simplified_transactions:
-        from_user = db.query(User).filter(User.id == from_id).first()
-        to_user = db.query(User).filter(User.id == to_id).first()
+        from_user = db.get(User, from_id)
+        to_user = db.get(User, to_id)
         
         simplified_debts.append({
             "from_user_id": from_id,
@@ -321,7 +319,7 @@ def create_settlement(
         HTTPException: If validation fails
     """
     # Verify group exists
-    group = db.query(Group).filter(Group.id == settlement_data.group_id).first()
+    group = db.get(Group, settlement_data.group_id)
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -436,7 +434,7 @@ def create_settlement(
     
     # Log activity
     try:
-        receiver = db.query(User).filter(User.id == settlement_data.receiver_id).first()
+        receiver = db.get(User, settlement_data.receiver_id)
         activity_service.log_settlement_created(
             db=db,
             user_id=payer_id,
@@ -456,8 +454,10 @@ def get_group_settlements(
     group_id: UUID,
     current_user_id: UUID,
     page: int = 1,
-    limit: int = 20
-) -> Tuple[List[Settlement], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    include_count: bool = False
+) -> Tuple[List[Settlement], Optional[int], Optional[str]]:
     """
     Get settlements for a group.
     
@@ -465,31 +465,57 @@ def get_group_settlements(
         db: Database session
         group_id: Group ID
         current_user_id: Current user ID
-        page: Page number
+        page: Page number (ignored when a cursor is given)
         limit: Items per page
+        cursor: Optional keyset cursor from a previous page's next_cursor
+        include_count: Also count the total on cursor pages
         
     Returns:
-        Tuple of (settlements list, total count)
+        Tuple of (settlements list, total count or None, next cursor)
     """
     # Verify user is a member
-    membership = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.user_id == current_user_id
-    ).first()
-    
-    if not membership:
+    if not verify_group_membership(db, group_id, current_user_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this group"
         )
     
-    # Query settlements
-    query = db.query(Settlement).filter(Settlement.group_id == group_id)
-    
-    total_count = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * limit
-    settlements = query.order_by(Settlement.date.desc(), Settlement.created_at.desc()).offset(offset).limit(limit).all()
-    
-    return settlements, total_count
+    # Query settlements; group, payer and receiver are batch-loaded with one
+    # IN query each instead of per-row lookups
+    query = db.query(Settlement).options(
+        selectinload(Settlement.group),
+        selectinload(Settlement.payer),
+        selectinload(Settlement.receiver),
+        raiseload("*")
+    ).filter(Settlement.group_id == group_id)
+    
+    # Most recent first
+    return paginate(
+        query,
+        (Settlement.date, Settlement.created_at, Settlement.id),
+        page,
+        limit,
+        cursor,
+        include_count
+    )
+
+
+def build_settlement_response(settlement: Settlement) -> SettlementResponse:
+    """Build a settlement response from a settlement with loaded relationships."""
+    group = settlement.group
+    payer = settlement.payer
+    receiver = settlement.receiver
+    
+    return SettlementResponse(
+        id=settlement.id,
+        group_id=settlement.group_id,
+        group_name=group.name if group else "Unknown",
+        payer_id=settlement.payer_id,
+        payer_name=payer.name if payer else "Unknown",
+        receiver_id=settlement.receiver_id,
+        receiver_name=receiver.name if receiver else "Unknown",
+        amount=settlement.amount,
+        settlement_date=settlement.date,
+        notes=settlement.notes,
+        created_at=settlement.created_at
+    )
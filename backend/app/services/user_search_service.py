@@ -1,5 +1,5 @@
 """User search service layer."""
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, selectinload
 from sqlalchemy import or_
 from typing import List
 from uuid import UUID
@@ -55,13 +55,19 @@ def get_pending_invitations_for_user(
     Returns:
         List of pending invitations
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         return []
     
-    # Get invitations by email or user ID
-    invitations = db.query(Invitation).filter(
+    # Get invitations by email or user ID, with groups and inviters
+    # batch-loaded for the response
+    invitations = db.query(Invitation).options(
+        selectinload(Invitation.group),
+        selectinload(Invitation.inviter),
+        raiseload("*")
+    ).filter(
         Invitation.status == InvitationStatus.PENDING,
+        ~Invitation.is_expired,
         or_(
             Invitation.invitee_id == user_id,
             Invitation.invitee_email == user.email
@@ -85,7 +91,10 @@ def get_sent_invitations(
     Returns:
         List of sent invitations
     """
-    invitations = db.query(Invitation).filter(
+    invitations = db.query(Invitation).options(
+        selectinload(Invitation.group),
+        raiseload("*")
+    ).filter(
         Invitation.inviter_id == user_id
     ).order_by(Invitation.created_at.desc()).all()
     
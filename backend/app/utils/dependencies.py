@@ -1,19 +1,80 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 from jose import JWTError
 from uuid import UUID
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
 
+from app.core.cache import cached_value, user_generation
 from app.core.database import get_db
 from app.core.security import verify_token
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.models.group import GroupMember, GroupMemberRole
 
 security = HTTPBearer()
 
+# With the shared cache, authenticated users are cached briefly so most
+# requests skip the lookup
+CURRENT_USER_TTL_SECONDS = 60
 
-async def get_current_user(
+
+def _query_user_fields(db: Session, user_id: UUID) -> Optional[Dict[str, Any]]:
+    """Fetch the user columns endpoints read from the current user."""
+    row = db.query(
+        User.name, User.email, User.avatar_url, User.role, User.created_at, User.updated_at
+    ).filter(User.id == user_id).first()
+    return row._asdict() if row else None
+
+
+def _load_current_user(db: Session, user_id: UUID) -> Optional[User]:
+    """
+    Load the current user, from the cache when possible.
+    
+    A cached user is attached to the session as a persistent instance
+    without a SELECT; columns that are not cached (the password hash) load
+    lazily on access, while relationship access raises unless the
+    relationship is eager-loaded. Without the shared Redis cache, or while
+    Redis is unavailable, the user is read from the database, so a profile
+    or role change is seen by every worker at once and a Redis outage never
+    blocks authentication.
+    
+    Args:
+        db: Database session
+        user_id: User ID from the token
+        
+    Returns:
+        User attached to the session, or None if it does not exist
+    """
+    generation = user_generation(user_id)
+    if generation is None:
+        return db.get(User, user_id)
+    
+    fields = cached_value(
+        user_id,
+        "current_user",
+        lambda: _query_user_fields(db, user_id),
+        ttl=CURRENT_USER_TTL_SECONDS,
+        generation=generation
+    )
+    if fields is None:
+        return None
+    
+    user = User(
+        id=user_id,
+        name=fields["name"],
+        email=fields["email"],
+        avatar_url=fields["avatar_url"],
+        role=UserRole(fields["role"]),
+        created_at=datetime.fromisoformat(fields["created_at"]),
+        updated_at=datetime.fromisoformat(fields["updated_at"])
+    )
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
+
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -21,7 +82,8 @@ async def get_current_user(
     Dependency to get the current authenticated user.
     
     Extracts JWT token from Authorization header, validates it,
-    and returns the user object.
+    and returns the user object. Declared with plain def so FastAPI runs
+    the blocking database lookup in the threadpool, not on the event loop.
     
     Raises:
         HTTPException: 401 if token is invalid or user not found
@@ -43,8 +105,8 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    # Fetch user from database
-    user = db.query(User).filter(User.id == UUID(user_id)).first()
+    # Fetch user (cached for a short time, dropped when the user changes)
+    user = _load_current_user(db, UUID(user_id))
     
     if user is None:
         raise HTTPException(
@@ -70,7 +132,30 @@ async def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-async def get_group_membership(
+def verify_group_membership(db: Session, group_id: UUID, user_id: UUID) -> bool:
+    """
+    Check whether a user is a member of a group.
+    
+    Uses EXISTS, so the database stops at the first matching index entry
+    instead of fetching the membership row.
+    
+    Args:
+        db: Database session
+        group_id: UUID of the group
+        user_id: UUID of the user
+        
+    Returns:
+        True if the user is a member of the group
+    """
+    return db.query(
+        db.query(GroupMember).filter(
+            GroupMember.group_id == group_id,
+            GroupMember.user_id == user_id
+        ).exists()
+    ).scalar()
+
+
+def get_group_membership(
     group_id: UUID,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -103,7 +188,7 @@ async def get_group_membership(
     return membership
 
 
-async def require_group_owner(
+def require_group_owner(
     group_id: UUID,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -0,0 +1,144 @@
+"""Keyset (cursor) pagination helpers."""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        values: Sort key values (datetime, date, UUID, ...) in ORDER BY order
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    raw = [v.isoformat() if isinstance(v, (date, datetime)) else str(v) for v in values]
+    return base64.urlsafe_b64encode(json.dumps(raw).encode()).decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string from the client
+        types: Expected type of each sort key value (datetime, date or UUID)
+
+    Returns:
+        Tuple of decoded sort key values
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise ValueError("cursor has wrong shape")
+
+        values = []
+        for expected, value in zip(types, raw):
+            if expected is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif expected is date:
+                values.append(date.fromisoformat(value))
+            else:
+                values.append(expected(value))
+        return tuple(values)
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def paginate(
+    query: Query,
+    sort_columns: Sequence[Any],
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    include_count: bool = False
+) -> Tuple[List[Any], Optional[int], Optional[str]]:
+    """
+    Fetch one page of a query ordered by ``sort_columns`` descending.
+
+    With a cursor the page starts right after the cursor row (keyset
+    pagination), so deep pages cost the same as the first one, and no total
+    is counted unless ``include_count`` asks for a separate COUNT query.
+    Without a cursor the classic page/offset is used and the total count
+    comes back in the same statement through a ``COUNT(*) OVER ()`` window.
+    One extra row is fetched to tell whether a next page exists.
+
+    Args:
+        query: Filtered ORM query over a single entity
+        sort_columns: Model attributes forming a unique sort key (end with the id)
+        page: Page number (ignored when a cursor is given)
+        limit: Items per page
+        cursor: Optional cursor from a previous page's next_cursor
+        include_count: Also count all matching rows on cursor pages
+
+    Returns:
+        Tuple of (items, total count or None, next cursor or None on the last page)
+    """
+    query = query.order_by(*(column.desc() for column in sort_columns))
+
+    if cursor:
+        # The window count would only cover rows after the cursor
+        total_count = query.order_by(None).count() if include_count else None
+        values = decode_cursor(cursor, *(column.type.python_type for column in sort_columns))
+        items = query.filter(tuple_(*sort_columns) < values).limit(limit + 1).all()
+    else:
+        rows = query.add_columns(
+            func.count().over().label("total_count")
+        ).offset((page - 1) * limit).limit(limit + 1).all()
+        items = [row[0] for row in rows]
+        if rows:
+            total_count = rows[0].total_count
+        else:
+            # Past the last page; count separately so the total stays right
+            total_count = query.order_by(None).count() if page > 1 else 0
+
+    # The extra row tells whether there is a next page, with or without a count
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(*(getattr(last, column.key) for column in sort_columns))
+
+    return items, total_count, next_cursor
+
+
+def page_info(
+    page: int,
+    limit: int,
+    total_count: Optional[int],
+    next_cursor: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build the pagination metadata of a list response.
+
+    Args:
+        page: Page number requested
+        limit: Items per page
+        total_count: Total matching rows, or None when not counted
+        next_cursor: Cursor of the next page, or None on the last page
+
+    Returns:
+        Pagination dictionary (totals are None when not counted)
+    """
+    return {
+        "page": page,
+        "limit": limit,
+        "total_count": total_count,
+        "total_pages": (total_count + limit - 1) // limit if total_count is not None else None,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor
+    }
@@ -0,0 +1,72 @@
+"""Response cache behaviour while Redis is unavailable."""
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("redis")
+
+from app.core import cache
+from app.models.user import User
+from app.utils import dependencies
+
+# Nothing listens here, so every command raises redis.ConnectionError
+UNREACHABLE_REDIS_URL = "redis://127.0.0.1:1/0"
+
+
+@pytest.fixture
+def failing_backend(monkeypatch):
+    backend = cache.RedisCacheBackend(UNREACHABLE_REDIS_URL)
+    monkeypatch.setattr(cache, "cache_backend", backend)
+    monkeypatch.setattr(cache, "CACHE_ENABLED", True)
+    return backend
+
+
+def test_backend_swallows_redis_errors(failing_backend):
+    assert failing_backend.get("resp:key") is None
+    assert failing_backend.generation("resp-gen:key") is None
+    failing_backend.set("resp:key", "{}", 60)
+    failing_backend.bump_generations(["resp-gen:key"])
+
+
+def test_cached_value_computes_uncached(failing_backend):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"total": len(calls)}
+
+    user_id = uuid4()
+    assert cache.cached_value(user_id, "summary", compute) == {"total": 1}
+    assert cache.cached_value(user_id, "summary", compute) == {"total": 2}
+
+
+def test_invalidation_after_commit_does_not_raise(failing_backend):
+    cache.invalidate_users([uuid4(), uuid4()])
+
+
+def test_etag_skipped(failing_backend):
+    @cache.etag_per_user
+    def endpoint(request, response, current_user):
+        return {"ok": True}
+
+    response = SimpleNamespace(headers={})
+    result = endpoint(
+        request=SimpleNamespace(headers={}),
+        response=response,
+        current_user=SimpleNamespace(id=uuid4())
+    )
+
+    assert result == {"ok": True}
+    assert "ETag" not in response.headers
+
+
+def test_current_user_read_from_database(failing_backend):
+    user = User(id=uuid4(), name="Alice", email="alice@example.com")
+
+    class FakeSession:
+        def get(self, model, user_id):
+            assert model is User and user_id == user.id
+            return user
+
+    assert dependencies._load_current_user(FakeSession(), user.id) is user